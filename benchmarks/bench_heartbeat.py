@@ -0,0 +1,53 @@
+"""Heartbeat and expiry cost for a large agent population.
+
+Usage: PYTHONPATH=src python benchmarks/bench_heartbeat.py [agents] [rounds]
+"""
+import sys
+import time
+
+from control_plane.liveness import LivenessTracker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def main() -> None:
+    agents = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    clock = _Clock()
+    tracker = LivenessTracker(ttl_seconds=30, tick_seconds=1, clock=clock)
+    keys = [(f"user-{i % 1000}", f"agent-{i}") for i in range(agents)]
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for user_id, role in keys:
+            tracker.beat(user_id, role)
+        clock.now += 5
+    beats = agents * rounds
+    elapsed = time.perf_counter() - started
+    print(f"agents={agents} rounds={rounds}")
+    print(f"heartbeat: {beats / elapsed:,.0f} beats/s ({elapsed / beats * 1e6:.2f} us/beat)")
+
+    started = time.perf_counter()
+    for i in range(1000):
+        tracker.live(f"user-{i}")
+    print(f"live query: {(time.perf_counter() - started) / 1000 * 1e6:.2f} us/user")
+
+    started = time.perf_counter()
+    idle = tracker.expire()
+    idle_elapsed = time.perf_counter() - started
+    clock.now += 60
+    started = time.perf_counter()
+    expired = tracker.expire()
+    elapsed = time.perf_counter() - started
+    print(f"idle expiry tick: {idle_elapsed * 1e6:.1f} us ({idle} expired)")
+    print(f"bulk expiry: {expired} agents in {elapsed * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
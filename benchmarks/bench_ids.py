@@ -0,0 +1,55 @@
+"""Id generation cost and list-by-range performance.
+
+Compares uuid4 with the time-ordered generator, then pages through a
+large task set with the id cursor versus the old filter-and-slice scan.
+
+Usage: PYTHONPATH=src python benchmarks/bench_ids.py [ids] [tasks]
+"""
+import sys
+import time
+import uuid
+
+from control_plane.ids import new_id
+from control_plane.store import InMemoryStore
+
+
+def _rate(fn, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    print(f"ids={count}")
+    print(f"uuid4: {_rate(lambda: str(uuid.uuid4()), count):,.0f} ids/s")
+    print(f"new_id: {_rate(new_id, count):,.0f} ids/s")
+
+    store = InMemoryStore()
+    for i in range(total):
+        store.create_task(f"user-{i % 10}", {"title": f"task {i}"})
+    print(f"tasks={total} users=10 page=50")
+
+    started = time.perf_counter()
+    pages = 0
+    cursor = None
+    while True:
+        items = store.list_tasks("user-3", 50, after=cursor)
+        pages += 1
+        if len(items) < 50:
+            break
+        cursor = items[-1]["id"]
+    elapsed = time.perf_counter() - started
+    print(f"cursor paging: {pages} pages in {elapsed * 1e3:.1f} ms ({elapsed / pages * 1e6:.1f} us/page)")
+
+    started = time.perf_counter()
+    for page in range(pages):
+        [t for t in store.tasks if t["user_id"] == "user-3"][page * 50 : page * 50 + 50]
+    elapsed = time.perf_counter() - started
+    print(f"scan + offset: {pages} pages in {elapsed * 1e3:.1f} ms ({elapsed / pages * 1e6:.1f} us/page)")
+
+
+if __name__ == "__main__":
+    main()
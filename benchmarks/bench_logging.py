@@ -0,0 +1,60 @@
+"""Caller-side cost of one access log record per request.
+
+Compares the legacy setup (text, written on the calling thread) with JSON
+records, an enqueued sink and sampling. The sink writes to /dev/null, and a
+"slow" variant sleeps 200us per write to mimic a stalled stderr pipe or log
+shipper. Times are what the request path pays per request.
+
+Usage: PYTHONPATH=src python benchmarks/bench_logging.py
+"""
+import os
+import random
+import time
+
+from loguru import logger
+
+ROUNDS = 5_000
+SLOW_WRITE_SECONDS = 0.0002
+
+
+def _sink(slow: bool):
+    devnull = open(os.devnull, "w")
+
+    def write(message) -> None:
+        if slow:
+            time.sleep(SLOW_WRITE_SECONDS)
+        devnull.write(message)
+
+    return write
+
+
+def _run(serialize: bool, enqueue: bool, sample_rate: float, slow: bool) -> float:
+    logger.remove()
+    logger.add(_sink(slow), level="INFO", serialize=serialize, enqueue=enqueue)
+    context = {"method": "GET", "route": "/api/mission-control/tasks", "status": 200, "user_id": "user-123"}
+    started = time.perf_counter()
+    for i in range(ROUNDS):
+        if sample_rate >= 1 or random.random() < sample_rate:
+            logger.info("{method} {route} {status} {latency_ms}ms", latency_ms=i % 50, **context)
+    elapsed = (time.perf_counter() - started) / ROUNDS
+    logger.complete()
+    logger.remove()
+    return elapsed
+
+
+def main() -> None:
+    modes = [
+        ("text, sync (legacy)", False, False, 1.0),
+        ("json, sync", True, False, 1.0),
+        ("json, enqueue", True, True, 1.0),
+        ("json, enqueue, 10% sample", True, True, 0.1),
+    ]
+    for slow in (False, True):
+        print("slow sink (200us/write)" if slow else "/dev/null sink")
+        for name, serialize, enqueue, sample_rate in modes:
+            per_request = _run(serialize, enqueue, sample_rate, slow)
+            print(f"  {name:28} {per_request * 1e6:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
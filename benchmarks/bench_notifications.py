@@ -0,0 +1,56 @@
+"""Notification dispatch throughput against a local stub sink.
+
+Pass an outbox path to measure a file-backed SQLite outbox instead of the
+in-memory one.
+
+Usage: PYTHONPATH=src python benchmarks/bench_notifications.py [events] [recipients] [outbox.db]
+"""
+import sys
+import threading
+import time
+
+from control_plane.notifications import NotificationDispatcher, NotificationOutbox
+from control_plane.plugins.registry import PluginRegistry
+from control_plane.store import InMemoryStore
+
+
+def main() -> None:
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    recipients = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    outbox_path = sys.argv[3] if len(sys.argv) > 3 else ":memory:"
+
+    delivered = 0
+    batches = 0
+    done = threading.Event()
+    lock = threading.Lock()
+
+    def stub_sink(recipient, batch):
+        nonlocal delivered, batches
+        with lock:
+            delivered += len(batch)
+            batches += 1
+            if delivered >= events:
+                done.set()
+
+    registry = PluginRegistry()
+    registry.register_service("notifications.stub", stub_sink)
+    store = InMemoryStore()
+    dispatcher = NotificationDispatcher(registry, NotificationOutbox(outbox_path), window_seconds=0.05)
+    store.subscribe(dispatcher.handle_event)
+    dispatcher.start()
+
+    started = time.perf_counter()
+    for i in range(events):
+        store.create_message(f"user-{i % recipients}", {"task_id": "t", "content": "x"}, "jarvis")
+    enqueued = time.perf_counter() - started
+    done.wait(60)
+    elapsed = time.perf_counter() - started
+    dispatcher.stop()
+
+    print(f"events={events} recipients={recipients}")
+    print(f"enqueue: {events / enqueued:,.0f} notifications/s ({enqueued / events * 1e6:.1f} us per write)")
+    print(f"end-to-end: {delivered / elapsed:,.0f} notifications/s in {batches} batches")
+
+
+if __name__ == "__main__":
+    main()
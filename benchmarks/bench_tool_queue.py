@@ -0,0 +1,45 @@
+"""Enqueue, lease and complete throughput of the tool request queue.
+
+Usage: PYTHONPATH=src python benchmarks/bench_tool_queue.py [requests] [users] [batch]
+"""
+import random
+import sys
+import time
+
+from control_plane.tool_queue import ToolRequestQueue
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    batch = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    queue = ToolRequestQueue()
+    rng = random.Random(0)
+
+    started = time.perf_counter()
+    for i in range(total):
+        queue.enqueue(f"user-{i % users}", "echo", {"message": i}, priority=rng.randint(0, 9))
+    elapsed = time.perf_counter() - started
+    print(f"requests={total} users={users} batch={batch}")
+    print(f"enqueue: {total / elapsed:,.0f} req/s")
+
+    leased = []
+    started = time.perf_counter()
+    for user in range(users):
+        while True:
+            items = queue.lease(f"user-{user}", "bench", max_items=batch)
+            if not items:
+                break
+            leased.extend(items)
+    elapsed = time.perf_counter() - started
+    print(f"lease: {len(leased) / elapsed:,.0f} req/s")
+
+    started = time.perf_counter()
+    for request in leased:
+        queue.complete(request.user_id, request.id, request.lease_token, result={})
+    elapsed = time.perf_counter() - started
+    print(f"complete: {len(leased) / elapsed:,.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from typing import Dict, Any
 
 def register(api) -> None:
     denylist = api.config.get("denylist", [])
-    case_sensitive = bool(api.config.get("case_sensitive", False))
+    case_sensitive = api.config.get("case_sensitive", False)
     flags = 0 if case_sensitive else re.IGNORECASE
     patterns = [re.compile(pattern, flags=flags) for pattern in denylist]
 
@@ -16,9 +16,9 @@ def register(api) -> None:
             if pattern.search(text):
                 raise api.PluginBlocked("Blocked by prompt guard policy")
 
-    api.register_hook("before_task_create", _check)
-    api.register_hook("before_message_post", _check)
-    api.register_hook("before_document_post", _check)
+    api.register_hook("before_task_create", _check, independent=True)
+    api.register_hook("before_message_post", _check, independent=True)
+    api.register_hook("before_document_post", _check, independent=True)
 
 
 def json_dump(payload: Dict[str, Any]) -> str:
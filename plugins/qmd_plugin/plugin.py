@@ -26,7 +26,7 @@ def _run_qmd(command: str, args: list[str], timeout: float) -> Dict[str, Any]:
 def register(api) -> None:
     command = api.config.get("command", "qmd")
     default_mode = api.config.get("default_mode", "search")
-    timeout = float(api.config.get("timeout_seconds", 30))
+    timeout = api.config.get("timeout_seconds", 30)
 
     def qmd_search(args: Dict[str, Any]) -> Dict[str, Any]:
         query = args.get("query")
@@ -7,7 +7,10 @@ def register(api) -> None:
     def before_task(payload: Dict[str, Any]) -> None:
         _ = greeting
 
-    api.register_hook("before_task_create", before_task)
+    api.register_hook("before_task_create", before_task, independent=True)
+
+    def echo(args: Dict[str, Any]) -> Dict[str, Any]:
+        return {"message": args.get("message")}
 
     api.register_tool(
         "echo",
@@ -15,5 +18,6 @@ def register(api) -> None:
             "name": "echo",
             "description": "Echo back a message.",
             "parameters": {"type": "object", "properties": {"message": {"type": "string"}}, "required": ["message"]},
+            "handler": echo,
         },
     )
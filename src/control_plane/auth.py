@@ -3,6 +3,7 @@ from fastapi import Header, HTTPException
 from typing import Optional, TypedDict
 
 from .config import load_config
+from .logs import bind_request
 
 
 class Actor(TypedDict):
@@ -26,4 +27,5 @@ def require_actor(x_agent_token: Optional[str] = Header(default=None)) -> Actor:
     if payload.get("type") != "agent" or not payload.get("user_id") or not payload.get("agent_role"):
         raise HTTPException(status_code=401, detail="Invalid agent token")
 
+    bind_request(user_id=payload["user_id"], agent_role=payload["agent_role"])
     return {"user_id": payload["user_id"], "agent_role": payload["agent_role"]}
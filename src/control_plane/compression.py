@@ -0,0 +1,259 @@
+import gzip
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install ".[zstd]"
+    zstandard = None
+
+
+BODY_METHODS = ("POST", "PUT", "PATCH")
+DECODE_ERRORS: Tuple[type, ...] = (zlib.error, EOFError) + ((zstandard.ZstdError,) if zstandard else ())
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+# Bodies at least this large are compressed on a worker thread so the event
+# loop keeps serving other requests; below it the thread hop costs more than
+# the codec. Compressed request chunks are offloaded at an eighth of this,
+# since they typically inflate several-fold.
+OFFLOAD_MIN_BYTES = 64 * 1024
+
+# Largest expansion a single zstd input byte can produce (an RLE block: a
+# 3-byte header plus one byte for up to 128 KiB). Input is fed in slices
+# sized from the remaining budget, so one call overshoots the limit by at
+# most one minimum step's worth of output (~512 KiB) however dense the bomb.
+_ZSTD_MAX_RATIO = 32 * 1024
+_ZSTD_MIN_STEP = 16
+
+
+class _GzipDecoder:
+    def __init__(self) -> None:
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def decode(self, chunk: bytes, limit: int) -> bytes:
+        return self._decompressor.decompress(chunk, limit)
+
+    def complete(self) -> bool:
+        return self._decompressor.eof and not self._decompressor.unused_data
+
+
+class _ZstdDecoder:
+    def __init__(self) -> None:
+        self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    def decode(self, chunk: bytes, limit: int) -> bytes:
+        out: List[bytes] = []
+        size = 0
+        view = memoryview(chunk)
+        position = 0
+        while position < len(view) and size < limit:
+            step = max(_ZSTD_MIN_STEP, (limit - size) // _ZSTD_MAX_RATIO)
+            piece = self._decompressor.decompress(view[position : position + step])
+            position += step
+            size += len(piece)
+            out.append(piece)
+        return b"".join(out)
+
+    def complete(self) -> bool:
+        return self._decompressor.eof and not self._decompressor.unused_data
+
+
+class _IdentityDecoder:
+    def decode(self, chunk: bytes, limit: int) -> bytes:
+        return chunk
+
+    def complete(self) -> bool:
+        return True
+
+
+Decoder = Union[_GzipDecoder, _ZstdDecoder, _IdentityDecoder]
+
+
+def supported_encodings() -> List[str]:
+    """Content codings this process can decode and produce, best first."""
+    return (["zstd"] if zstandard is not None else []) + ["gzip"]
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = 5, zstd_level: int = 3) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=zstd_level).compress(body)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """Negotiates gzip/zstd for request and response bodies.
+
+    Request bodies are decoded chunk by chunk as they arrive and rejected
+    with 413 as soon as the raw or decoded size passes ``max_body_bytes``,
+    before the application parses anything. Responses of at least
+    ``min_size`` bytes with a JSON or text content type are compressed with
+    the best coding the client accepts. Work on bodies or chunks of at least
+    ``offload_min_bytes`` runs in a worker thread instead of on the event loop.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_body_bytes: int = 5 * 1024 * 1024,
+        min_size: int = 1024,
+        offload_min_bytes: int = OFFLOAD_MIN_BYTES,
+        gzip_level: int = 5,
+        zstd_level: int = 3,
+    ) -> None:
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.min_size = min_size
+        self.offload_min_bytes = offload_min_bytes
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+        self._decoders: Dict[str, Callable[[], Decoder]] = {
+            "identity": _IdentityDecoder,
+            "gzip": _GzipDecoder,
+        }
+        if zstandard is not None:
+            self._decoders["zstd"] = _ZstdDecoder
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if scope["method"] in BODY_METHODS:
+            encoding = headers.get("content-encoding", "identity").strip().lower() or "identity"
+            if encoding not in self._decoders:
+                await _reject(scope, receive, send, 415, "unsupported content-encoding")
+                return
+            length = headers.get("content-length")
+            if length and length.isdigit() and int(length) > self.max_body_bytes:
+                await _reject(scope, receive, send, 413, "request body too large")
+                return
+            body, error = await self._read_body(receive, self._decoders[encoding]())
+            if error is not None:
+                await _reject(scope, receive, send, *error)
+                return
+            scope["headers"] = [
+                (key, value)
+                for key, value in scope["headers"]
+                if key not in (b"content-encoding", b"content-length")
+            ]
+            scope["headers"].append((b"content-length", str(len(body)).encode("latin-1")))
+            receive = _replay(body, receive)
+
+        encoding = negotiate(headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSend(send, encoding, self))
+
+    async def _read_body(self, receive: Receive, decoder: Decoder) -> Tuple[bytes, Optional[Tuple[int, str]]]:
+        chunks: List[bytes] = []
+        raw_size = 0
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunk = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            raw_size += len(chunk)
+            if raw_size > self.max_body_bytes:
+                return b"", (413, "request body too large")
+            try:
+                limit = self.max_body_bytes - size + 1
+                if not isinstance(decoder, _IdentityDecoder) and len(chunk) >= self.offload_min_bytes // 8:
+                    decoded = await anyio.to_thread.run_sync(decoder.decode, chunk, limit)
+                else:
+                    decoded = decoder.decode(chunk, limit)
+            except DECODE_ERRORS as exc:
+                return b"", (400, f"invalid request body encoding: {exc}")
+            size += len(decoded)
+            if size > self.max_body_bytes:
+                return b"", (413, "request body too large")
+            chunks.append(decoded)
+        if not decoder.complete():
+            return b"", (400, "invalid request body encoding: truncated stream or trailing data")
+        return b"".join(chunks), None
+
+
+async def _reject(scope: Scope, receive: Receive, send: Send, status_code: int, detail: str) -> None:
+    await JSONResponse({"detail": detail}, status_code=status_code)(scope, receive, send)
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+class _CompressingSend:
+    def __init__(self, send: Send, encoding: str, middleware: CompressionMiddleware) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.middleware = middleware
+        self.start: Optional[Message] = None
+        self.chunks: List[bytes] = []
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.start is None:
+            await self.send(message)
+            return
+        self.chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+
+        start, self.start = dict(self.start), None
+        body = b"".join(self.chunks)
+        headers = MutableHeaders(raw=list(start.get("headers", [])))
+        start["headers"] = headers.raw
+        compressible = (
+            len(body) >= self.middleware.min_size
+            and start["status"] not in (204, 304)
+            and "content-encoding" not in headers
+            and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+        )
+        if compressible:
+            middleware = self.middleware
+            args = (body, self.encoding, middleware.gzip_level, middleware.zstd_level)
+            if len(body) >= middleware.offload_min_bytes:
+                body = await anyio.to_thread.run_sync(compress, *args)
+            else:
+                body = compress(*args)
+            headers["Content-Encoding"] = self.encoding
+            headers["Content-Length"] = str(len(body))
+        headers.add_vary_header("Accept-Encoding")
+        await self.send(start)
+        await self.send({"type": "http.response.body", "body": body, "more_body": False})
@@ -1,6 +1,6 @@
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
@@ -12,6 +12,8 @@ class PluginConfig:
     entries: Dict[str, Dict[str, Any]]
     slots: Dict[str, str]
     load_paths: List[str]
+    hooks: Dict[str, Any] = field(default_factory=dict)
+    sandbox: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -21,6 +23,13 @@ class AppConfig:
     plugin_config_path: Optional[str]
     plugin_paths: List[str]
     plugins: PluginConfig
+    notifications_outbox_path: str = ":memory:"
+    heartbeat_ttl_seconds: float = 30.0
+    max_body_bytes: int = 5 * 1024 * 1024
+    compress_min_bytes: int = 1024
+    log_format: str = "text"
+    log_enqueue: bool = False
+    access_log_sample_rate: float = 1.0
 
 
 def _load_plugin_config(path: Optional[str]) -> Dict[str, Any]:
@@ -42,6 +51,14 @@ def load_config() -> AppConfig:
         if p.strip()
     ]
 
+    notifications_outbox_path = os.getenv("CONTROL_PLANE_NOTIFICATIONS_OUTBOX", ":memory:")
+    heartbeat_ttl_seconds = float(os.getenv("CONTROL_PLANE_HEARTBEAT_TTL_SECONDS", "30"))
+    max_body_bytes = int(os.getenv("CONTROL_PLANE_MAX_BODY_BYTES", str(5 * 1024 * 1024)))
+    compress_min_bytes = int(os.getenv("CONTROL_PLANE_COMPRESS_MIN_BYTES", "1024"))
+    log_format = os.getenv("CONTROL_PLANE_LOG_FORMAT", "text").strip().lower()
+    log_enqueue = os.getenv("CONTROL_PLANE_LOG_ENQUEUE", "").strip().lower() in ("1", "true", "yes")
+    access_log_sample_rate = float(os.getenv("CONTROL_PLANE_ACCESS_LOG_SAMPLE", "1"))
+
     raw = _load_plugin_config(plugin_config_path).get("plugins", {})
     plugins = PluginConfig(
         enabled=bool(raw.get("enabled", True)),
@@ -50,6 +67,8 @@ def load_config() -> AppConfig:
         entries=dict(raw.get("entries", {})),
         slots=dict(raw.get("slots", {})),
         load_paths=list(raw.get("load", {}).get("paths", [])),
+        hooks=dict(raw.get("hooks", {})),
+        sandbox=dict(raw.get("sandbox", {})),
     )
 
     return AppConfig(
@@ -58,4 +77,11 @@ def load_config() -> AppConfig:
         plugin_config_path=plugin_config_path,
         plugin_paths=plugin_paths,
         plugins=plugins,
+        notifications_outbox_path=notifications_outbox_path,
+        heartbeat_ttl_seconds=heartbeat_ttl_seconds,
+        max_body_bytes=max_body_bytes,
+        compress_min_bytes=compress_min_bytes,
+        log_format=log_format,
+        log_enqueue=log_enqueue,
+        access_log_sample_rate=access_log_sample_rate,
     )
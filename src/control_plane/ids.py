@@ -0,0 +1,71 @@
+import os
+import random
+import threading
+import time
+
+
+_COUNTER_BITS = 42
+_NODE_BITS = 32
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+
+
+class IdGenerator:
+    """Monotonic UUIDv7-style identifiers.
+
+    Layout (128 bits): 48-bit Unix milliseconds, version 7, a 42-bit counter
+    split across ``rand_a``/``rand_b``, the RFC 4122 variant, and a 32-bit
+    per-process node drawn once from the OS (and again after ``fork``).
+    Within a process ids sort in creation order as plain strings. The node
+    keeps ids from separate processes distinct, with no OS randomness per call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+        self._node = 0
+        self.reseed()
+
+    def reseed(self) -> None:
+        self._node = int.from_bytes(os.urandom(4), "big")
+        self._counter = random.getrandbits(_COUNTER_BITS - 8)
+
+    def new(self) -> str:
+        with self._lock:
+            ms = time.time_ns() // 1_000_000
+            if ms > self._last_ms:
+                self._last_ms = ms
+                self._counter = random.getrandbits(_COUNTER_BITS - 8)
+            elif self._counter < _COUNTER_MAX:
+                self._counter += 1
+            else:
+                self._last_ms += 1
+                self._counter = 0
+            ms, counter = self._last_ms, self._counter
+        value = (
+            (ms << 80)
+            | (0x7 << 76)
+            | ((counter >> 30) << 64)
+            | (0b10 << 62)
+            | ((counter & 0x3FFFFFFF) << _NODE_BITS)
+            | self._node
+        )
+        raw = f"{value:032x}"
+        return f"{raw[:8]}-{raw[8:12]}-{raw[12:16]}-{raw[16:20]}-{raw[20:]}"
+
+
+def floor_id(timestamp: float) -> str:
+    """Smallest id that can be generated at ``timestamp``; use as a range bound."""
+    raw = f"{(int(timestamp * 1000) << 80) | (0x7 << 76) | (0b10 << 62):032x}"
+    return f"{raw[:8]}-{raw[8:12]}-{raw[12:16]}-{raw[16:20]}-{raw[20:]}"
+
+
+def id_timestamp(value: str) -> float:
+    return int(value[:8] + value[9:13], 16) / 1000
+
+
+_generator = IdGenerator()
+new_id = _generator.new
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_generator.reseed)
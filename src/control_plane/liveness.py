@@ -0,0 +1,135 @@
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+
+AgentKey = Tuple[str, str]
+
+
+@dataclass
+class LivenessEvent:
+    type: str
+    user_id: str
+    agent_role: str
+    at: float = field(default_factory=time.time)
+
+
+LivenessListener = Callable[[LivenessEvent], None]
+
+
+class LivenessTracker:
+    """Tracks agent heartbeats keyed by (user_id, agent_role).
+
+    Deadlines live in a timer wheel of ``ttl / tick`` slots, so a heartbeat
+    moves its key between two slot sets in O(1) and expiry only visits the
+    slots whose tick has passed. Expiry is accurate to ``tick_seconds``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        tick_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.tick_seconds = tick_seconds
+        self._clock = clock
+        self._slots: List[Set[AgentKey]] = [set() for _ in range(math.ceil(ttl_seconds / tick_seconds) + 2)]
+        self._expires_at: Dict[AgentKey, int] = {}
+        self._last_seen: Dict[str, Dict[str, float]] = {}
+        self._cursor = self._tick(clock())
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.listeners: List[LivenessListener] = []
+
+    def subscribe(self, listener: LivenessListener) -> None:
+        self.listeners.append(listener)
+
+    def beat(self, user_id: str, agent_role: str) -> float:
+        """Record a heartbeat and return the wall-clock time it was seen."""
+        key = (user_id, agent_role)
+        seen = time.time()
+        with self._lock:
+            now = self._clock()
+            expired = self._advance(now)
+            deadline = self._tick(now + self.ttl_seconds) + 1
+            previous = self._expires_at.get(key)
+            if previous is not None:
+                self._slots[previous % len(self._slots)].discard(key)
+            self._slots[deadline % len(self._slots)].add(key)
+            self._expires_at[key] = deadline
+            self._last_seen.setdefault(user_id, {})[agent_role] = seen
+        events = [LivenessEvent("agent.expired", *k) for k in expired]
+        if previous is None:
+            events.append(LivenessEvent("agent.online", user_id, agent_role, seen))
+        self._emit(events)
+        return seen
+
+    def live(self, user_id: str) -> Dict[str, float]:
+        """Live agent roles for a user mapped to their last heartbeat time."""
+        with self._lock:
+            expired = self._advance(self._clock())
+            agents = dict(self._last_seen.get(user_id, {}))
+        self._emit([LivenessEvent("agent.expired", *k) for k in expired])
+        return agents
+
+    def expire(self) -> int:
+        with self._lock:
+            expired = self._advance(self._clock())
+        self._emit([LivenessEvent("agent.expired", *k) for k in expired])
+        return len(expired)
+
+    def count(self) -> int:
+        return len(self._expires_at)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="liveness", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _tick(self, at: float) -> int:
+        return int(at // self.tick_seconds)
+
+    def _advance(self, now: float) -> List[AgentKey]:
+        target = self._tick(now)
+        if target <= self._cursor:
+            return []
+        expired: List[AgentKey] = []
+        steps = min(target - self._cursor, len(self._slots))
+        for offset in range(1, steps + 1):
+            slot = self._slots[(self._cursor + offset) % len(self._slots)]
+            for key in slot:
+                del self._expires_at[key]
+                roles = self._last_seen[key[0]]
+                del roles[key[1]]
+                if not roles:
+                    del self._last_seen[key[0]]
+                expired.append(key)
+            slot.clear()
+        self._cursor = target
+        return expired
+
+    def _emit(self, events: List[LivenessEvent]) -> None:
+        for event in events:
+            for listener in self.listeners:
+                try:
+                    listener(event)
+                except Exception:
+                    logger.exception("Liveness listener failed for {}", event.type)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.tick_seconds):
+            self.expire()
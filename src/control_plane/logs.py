@@ -0,0 +1,111 @@
+import contextvars
+import logging
+import random
+import sys
+import time
+from typing import Any, Dict, Optional
+
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import AppConfig
+
+
+_LEVEL_NAMES = {
+    logging.CRITICAL: "CRITICAL",
+    logging.ERROR: "ERROR",
+    logging.WARNING: "WARNING",
+    logging.INFO: "INFO",
+    logging.DEBUG: "DEBUG",
+}
+
+request_context: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "request_context", default=None
+)
+
+
+class _InterceptHandler(logging.Handler):
+    """Route stdlib log records into loguru."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        level = _LEVEL_NAMES.get(record.levelno, record.levelno)
+        logger.opt(depth=6, exception=record.exc_info).log(level, record.getMessage())
+
+
+class _SampleFilter(logging.Filter):
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.rate >= 1 or random.random() < self.rate
+
+
+def _attach_context(record: Dict[str, Any]) -> None:
+    context = request_context.get()
+    if context:
+        record["extra"].update(context)
+
+
+def bind_request(**values: Any) -> None:
+    """Attach fields (e.g. ``user_id``) to the current request's log context."""
+    context = request_context.get()
+    if context is not None:
+        context.update(values)
+
+
+def configure_logging(cfg: AppConfig) -> None:
+    """Install loguru sinks and intercept stdlib logging (uvicorn, etc.).
+
+    ``log_format="json"`` writes one serialized record per line.
+    ``log_enqueue`` moves the sink write off the calling thread. In JSON mode
+    uvicorn's access log is replaced by ``AccessLogMiddleware``, which emits a
+    structured record per request. ``access_log_sample_rate`` thins either
+    kind of access log.
+    """
+    structured = cfg.log_format == "json"
+    logger.remove()
+    logger.configure(patcher=_attach_context)
+    logger.add(sys.stderr, level="DEBUG", serialize=structured, enqueue=cfg.log_enqueue)
+
+    logging.basicConfig(handlers=[_InterceptHandler()], level=logging.INFO, force=True)
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        logging.getLogger(name).handlers = [_InterceptHandler()]
+    access = logging.getLogger("uvicorn.access")
+    access.filters = [_SampleFilter(cfg.access_log_sample_rate)]
+    access.disabled = structured
+
+
+class AccessLogMiddleware:
+    """Per-request context and a sampled structured access record."""
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        context: Dict[str, Any] = {"method": scope["method"], "path": scope["path"]}
+        token = request_context.set(context)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            context["route"] = getattr(route, "path", scope["path"])
+            context["status"] = status
+            context["latency_ms"] = round((time.perf_counter() - started) * 1000, 3)
+            if self.sample_rate >= 1 or random.random() < self.sample_rate:
+                logger.info("{method} {route} {status} {latency_ms}ms", **context)
+            request_context.reset(token)
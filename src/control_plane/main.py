@@ -1,35 +1,37 @@
 from contextlib import asynccontextmanager
-import logging
 import sys
+import time
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request
 from loguru import logger
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from .auth import require_actor
 from .config import load_config
-from .models import TaskIn, TaskOut, MessageIn, MessageOut, DocumentIn, DocumentOut
+from .models import (
+    TaskIn,
+    TaskOut,
+    TaskStatusIn,
+    MessageIn,
+    MessageOut,
+    DocumentIn,
+    DocumentOut,
+    ToolLeaseIn,
+    ToolRequestIn,
+    ToolResultIn,
+)
 from .store import InMemoryStore
+from .notifications import NotificationDispatcher, NotificationOutbox
+from .liveness import LivenessEvent, LivenessTracker
+from .standup import StandupRollups
+from .tool_queue import LeaseError, ToolRequestQueue
+from .response_cache import ResponseCache
+from .compression import CompressionMiddleware
+from .logs import AccessLogMiddleware, configure_logging
+from .plugins.hooks import HookPipeline
 from .plugins.loader import load_plugins
 from .plugins.runtime import PluginBlocked
 
-# ---------------------------------------------------------------------------
-# Loguru — intercept all stdlib logging (uvicorn, etc.) into loguru
-# ---------------------------------------------------------------------------
-
-class _InterceptHandler(logging.Handler):
-    """Route stdlib log records into loguru."""
-    def emit(self, record: logging.LogRecord) -> None:
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-        logger.opt(depth=6, exception=record.exc_info).log(level, record.getMessage())
-
-logging.basicConfig(handlers=[_InterceptHandler()], level=logging.INFO, force=True)
-for _name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
-    logging.getLogger(_name).handlers = [_InterceptHandler()]
-
 # ---------------------------------------------------------------------------
 # Startup banner
 # ---------------------------------------------------------------------------
@@ -55,60 +57,121 @@ async def lifespan(app: FastAPI):
         print(f"  \033[1m▶\033[0m  API: \033[4m{base}\033[0m")
         print(f"  \033[1m▶\033[0m  Health: \033[4m{base}/health\033[0m\n")
     logger.info("Control plane ready — {} plugin(s) loaded", len(registry.hooks))
+    notifications.start()
+    liveness.start()
     yield
     logger.info("Shutting down")
+    liveness.stop(timeout=5)
+    notifications.stop(timeout=5)
+    hook_pipeline.shutdown(timeout=5)
+    if registry.sandbox is not None:
+        registry.sandbox.shutdown()
+    await logger.complete()
 
 
 app = FastAPI(lifespan=lifespan)
 store = InMemoryStore()
 cfg = load_config()
+configure_logging(cfg)
+app.add_middleware(CompressionMiddleware, max_body_bytes=cfg.max_body_bytes, min_size=cfg.compress_min_bytes)
+if cfg.log_format == "json":
+    app.add_middleware(AccessLogMiddleware, sample_rate=cfg.access_log_sample_rate)
 registry = load_plugins(cfg)
+hook_pipeline = HookPipeline.from_config(registry, cfg.plugins)
+notifications = NotificationDispatcher(registry, NotificationOutbox(cfg.notifications_outbox_path))
+store.subscribe(notifications.handle_event)
+tool_requests = ToolRequestQueue()
+standup_rollups = StandupRollups()
+store.subscribe(standup_rollups.handle_event)
+liveness = LivenessTracker(ttl_seconds=cfg.heartbeat_ttl_seconds)
+response_cache = ResponseCache()
+store.subscribe(lambda event: response_cache.bump_user(event.user_id))
 
 
 def _run_hooks(name: str, payload: Dict[str, Any]) -> None:
-    for hook in registry.hooks.get(name, []):
-        try:
-            hook(payload)
-        except PluginBlocked as exc:
-            raise HTTPException(status_code=exc.status_code, detail=str(exc))
+    try:
+        hook_pipeline.run(name, payload)
+    except PluginBlocked as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc))
+
+
+def _dispatch_hooks(name: str, payload: Dict[str, Any]) -> None:
+    hook_pipeline.dispatch(name, payload)
+
+
+def _on_liveness(event: LivenessEvent) -> None:
+    if event.type == "agent.expired":
+        _dispatch_hooks(
+            "after_agent_expire",
+            {"user_id": event.user_id, "agent_role": event.agent_role, "at": event.at},
+        )
+
+
+liveness.subscribe(_on_liveness)
 
 
 @app.get("/health")
 def health():
-    return {"status": "ok"}
+    body = {"status": "ok", "hooks": hook_pipeline.stats(), "notifications": notifications.stats()}
+    if registry.sandbox is not None:
+        body["sandbox"] = registry.sandbox.stats()
+    return body
+
+
+CAPABILITIES = {
+    "contract_version": "v1",
+    "features": {
+        "tasks": True,
+        "messages": True,
+        "documents": True,
+        "notifications_dispatch": True,
+        "events_sse": False,
+        "heartbeat": True,
+        "standup": True,
+        "tool_requests": True,
+    },
+}
 
 
 @app.get("/api/mission-control/capabilities")
-def capabilities(actor=Depends(require_actor)):
-    return {
-        "contract_version": "v1",
-        "features": {
-            "tasks": True,
-            "messages": True,
-            "documents": True,
-            "notifications_dispatch": False,
-            "events_sse": False,
-            "heartbeat": False,
-            "standup": False,
-            "tool_requests": False,
-        },
-    }
+def capabilities(request: Request, actor=Depends(require_actor)):
+    return response_cache.respond(request, "capabilities", lambda: CAPABILITIES)
 
 
 @app.get("/api/mission-control/tasks", response_model=Dict[str, Any])
-def list_tasks(limit: int = 50, actor=Depends(require_actor)):
-    items = store.list_tasks(actor["user_id"], min(max(limit, 1), 100))
-    return {"items": items}
+def list_tasks(
+    request: Request, limit: int = 50, after: Optional[str] = None, actor=Depends(require_actor)
+):
+    limit = min(max(limit, 1), 100)
+
+    def build() -> Dict[str, Any]:
+        items = store.list_tasks(actor["user_id"], limit, after)
+        return {"items": items, "next_cursor": items[-1]["id"] if len(items) == limit else None}
+
+    return response_cache.respond(request, f"tasks:{limit}:{after or ''}", build, user_id=actor["user_id"])
 
 
 @app.post("/api/mission-control/tasks", response_model=TaskOut)
 def create_task(payload: TaskIn, actor=Depends(require_actor)):
     _run_hooks("before_task_create", {"user_id": actor["user_id"], "payload": payload.model_dump()})
     try:
-        task = store.create_task(actor["user_id"], payload.model_dump())
+        task = store.create_task(actor["user_id"], payload.model_dump(), actor["agent_role"])
     except ValueError:
         raise HTTPException(status_code=409, detail="idempotency_key conflict")
-    _run_hooks("after_task_create", {"user_id": actor["user_id"], "task": task})
+    _dispatch_hooks("after_task_create", {"user_id": actor["user_id"], "task": task})
+    return task
+
+
+@app.patch("/api/mission-control/tasks/{task_id}", response_model=TaskOut)
+def update_task(task_id: str, payload: TaskStatusIn, actor=Depends(require_actor)):
+    _run_hooks(
+        "before_task_update",
+        {"user_id": actor["user_id"], "task_id": task_id, "payload": payload.model_dump()},
+    )
+    task = store.update_task_status(actor["user_id"], task_id, payload.status, actor["agent_role"])
+    if task is None:
+        raise HTTPException(status_code=404, detail="task not found")
+    _dispatch_hooks("after_task_update", {"user_id": actor["user_id"], "task": task})
     return task
 
 
@@ -116,10 +179,10 @@ def create_task(payload: TaskIn, actor=Depends(require_actor)):
 def post_message(payload: MessageIn, actor=Depends(require_actor)):
     _run_hooks("before_message_post", {"user_id": actor["user_id"], "payload": payload.model_dump()})
     try:
-        message = store.create_message(actor["user_id"], payload.model_dump())
+        message = store.create_message(actor["user_id"], payload.model_dump(), actor["agent_role"])
     except ValueError:
         raise HTTPException(status_code=409, detail="idempotency_key conflict")
-    _run_hooks("after_message_post", {"user_id": actor["user_id"], "message": message})
+    _dispatch_hooks("after_message_post", {"user_id": actor["user_id"], "message": message})
     return message
 
 
@@ -127,17 +190,34 @@ def post_message(payload: MessageIn, actor=Depends(require_actor)):
 def post_document(payload: DocumentIn, actor=Depends(require_actor)):
     _run_hooks("before_document_post", {"user_id": actor["user_id"], "payload": payload.model_dump()})
     try:
-        document = store.create_document(actor["user_id"], payload.model_dump())
+        document = store.create_document(actor["user_id"], payload.model_dump(), actor["agent_role"])
     except ValueError:
         raise HTTPException(status_code=409, detail="idempotency_key conflict")
-    _run_hooks("after_document_post", {"user_id": actor["user_id"], "document": document})
+    _dispatch_hooks("after_document_post", {"user_id": actor["user_id"], "document": document})
     return document
 
 
+@app.get("/api/mission-control/standup")
+def standup(hours: float = 24, actor=Depends(require_actor)):
+    window = min(max(hours, 0), 24 * 7)
+    return standup_rollups.summary(actor["user_id"], since=time.time() - window * 3600)
+
+
+@app.post("/api/mission-control/heartbeat")
+def heartbeat(actor=Depends(require_actor)):
+    seen = liveness.beat(actor["user_id"], actor["agent_role"])
+    return {"agent_role": actor["agent_role"], "last_seen": seen, "ttl_seconds": liveness.ttl_seconds}
+
+
+@app.get("/api/mission-control/heartbeat")
+def live_agents(actor=Depends(require_actor)):
+    agents = liveness.live(actor["user_id"])
+    return {"items": [{"agent_role": role, "last_seen": seen} for role, seen in agents.items()]}
+
+
 @app.get("/api/tools")
-def list_tools(actor=Depends(require_actor)):
-    tools = list(registry.tools.values())
-    return {"tools": tools}
+def list_tools(request: Request, actor=Depends(require_actor)):
+    return response_cache.respond(request, "tools", lambda: {"tools": registry.tool_list()})
 
 
 @app.post("/api/tools/{name}")
@@ -147,3 +227,40 @@ def execute_tool(name: str, payload: Dict[str, Any], actor=Depends(require_actor
         return {"message": args.get("message")}
 
     raise HTTPException(status_code=404, detail="tool not found")
+
+
+@app.post("/api/tool-requests", status_code=202)
+def enqueue_tool_request(payload: ToolRequestIn, actor=Depends(require_actor)):
+    if payload.tool not in registry.tools:
+        raise HTTPException(status_code=404, detail="tool not found")
+    request = tool_requests.enqueue(actor["user_id"], payload.tool, payload.arguments, payload.priority)
+    return request.public()
+
+
+@app.post("/api/tool-requests/lease")
+def lease_tool_requests(payload: ToolLeaseIn, actor=Depends(require_actor)):
+    leased = tool_requests.lease(
+        actor["user_id"], payload.worker_id, payload.max_items, payload.visibility_timeout
+    )
+    return {"items": [request.leased() for request in leased]}
+
+
+@app.get("/api/tool-requests/{request_id}")
+async def get_tool_request(request_id: str, wait: float = 0, actor=Depends(require_actor)):
+    request = await tool_requests.wait(actor["user_id"], request_id, min(max(wait, 0), 30))
+    if request is None:
+        raise HTTPException(status_code=404, detail="tool request not found")
+    return request.public()
+
+
+@app.post("/api/tool-requests/{request_id}/result")
+def complete_tool_request(request_id: str, payload: ToolResultIn, actor=Depends(require_actor)):
+    try:
+        request = tool_requests.complete(
+            actor["user_id"], request_id, payload.lease_token, payload.result, payload.error
+        )
+    except KeyError:
+        raise HTTPException(status_code=404, detail="tool request not found")
+    except LeaseError:
+        raise HTTPException(status_code=409, detail="lease expired or not held")
+    return request.public()
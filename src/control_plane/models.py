@@ -1,16 +1,22 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+TaskStatus = Literal["inbox", "assigned", "in_progress", "review", "blocked", "done"]
+
 
 class TaskIn(BaseModel):
     title: str
-    status: str = "in_progress"
+    status: TaskStatus = "in_progress"
     description: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
     idempotency_key: Optional[str] = None
 
 
+class TaskStatusIn(BaseModel):
+    status: TaskStatus
+
+
 class TaskOut(BaseModel):
     id: str
     user_id: str
@@ -54,3 +60,21 @@ class DocumentOut(BaseModel):
     title: str
     content: str
     doc_type: Optional[str] = None
+
+
+class ToolRequestIn(BaseModel):
+    tool: str
+    arguments: Dict[str, Any] = Field(default_factory=dict)
+    priority: int = 0
+
+
+class ToolLeaseIn(BaseModel):
+    worker_id: str
+    max_items: int = Field(default=1, ge=1, le=100)
+    visibility_timeout: Optional[float] = Field(default=None, gt=0, le=3600)
+
+
+class ToolResultIn(BaseModel):
+    lease_token: str
+    result: Optional[Any] = None
+    error: Optional[str] = None
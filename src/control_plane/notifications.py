@@ -0,0 +1,259 @@
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from .plugins.registry import NotificationSink, PluginRegistry
+from .store import StoreEvent
+
+
+NOTIFICATION_SINK_PREFIX = "notifications."
+NOTIFY_EVENTS = ("message.created", "document.created")
+HUMAN_ACTOR_TYPES = ("human", "user")
+
+OutboxRow = Tuple[int, str, str, Dict[str, Any], int]
+OutboxEntry = Tuple[List[str], str, Dict[str, Any], float]
+
+
+class NotificationOutbox:
+    """SQLite-backed outbox; one row per (sink, notification).
+
+    Rows are claimed with a lease by pushing ``due_at`` forward, so a crashed
+    or slow delivery is retried once the lease runs out. Pass a file path to
+    keep undelivered notifications across restarts.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS outbox ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " sink TEXT NOT NULL,"
+                " recipient TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " due_at REAL NOT NULL,"
+                " dead INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox (dead, due_at)")
+
+    def add(self, entries: List[OutboxEntry]) -> None:
+        """Insert ``(sinks, recipient, payload, due_at)`` entries in one transaction."""
+        rows = []
+        for sinks, recipient, payload, due_at in entries:
+            raw = json.dumps(payload)
+            rows.extend((sink, recipient, raw, due_at) for sink in sinks)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO outbox (sink, recipient, payload, due_at) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def claim(self, now: float, limit: int, lease_seconds: float) -> List[OutboxRow]:
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, sink, recipient, payload, attempts FROM outbox"
+                " WHERE dead = 0 AND due_at <= ? ORDER BY id LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE outbox SET due_at = ? WHERE id = ?",
+                [(now + lease_seconds, row[0]) for row in rows],
+            )
+        return [(row[0], row[1], row[2], json.loads(row[3]), row[4]) for row in rows]
+
+    def ack(self, ids: List[int]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in ids])
+
+    def retry(self, schedule: List[Tuple[int, float]]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, due_at = ? WHERE id = ?",
+                [(due_at, i) for i, due_at in schedule],
+            )
+
+    def bury(self, ids: List[int]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, dead = 1 WHERE id = ?", [(i,) for i in ids]
+            )
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT dead, COUNT(*) FROM outbox GROUP BY dead").fetchall()
+        counts = dict(rows)
+        return {"pending": counts.get(0, 0), "dead": counts.get(1, 0)}
+
+
+class NotificationDispatcher:
+    """Turns store writes into batched notifications for the owning user.
+
+    Agent-authored messages and documents are buffered in memory on the
+    request thread and written to the outbox, once per sink, by the dispatch
+    thread in a single transaction per window. When the buffer holds
+    ``buffer_limit`` entries the writer flushes it inline instead. Every
+    ``window_seconds`` the dispatcher also claims due rows, coalesces
+    them per (sink, recipient) into batches of up to ``batch_size``, and
+    delivers them on a pool of ``concurrency`` threads. Failed batches are
+    retried with exponential backoff and marked dead after ``max_attempts``.
+
+    Sinks are plugin services registered under the ``notifications.`` prefix
+    and are called as ``sink(recipient, batch)``.
+    """
+
+    def __init__(
+        self,
+        registry: PluginRegistry,
+        outbox: NotificationOutbox,
+        window_seconds: float = 0.25,
+        batch_size: int = 100,
+        concurrency: int = 4,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 1.0,
+        lease_seconds: float = 30.0,
+        claim_limit: int = 5000,
+        buffer_limit: int = 10000,
+    ) -> None:
+        self.registry = registry
+        self.outbox = outbox
+        self.window_seconds = window_seconds
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.lease_seconds = lease_seconds
+        self.claim_limit = claim_limit
+        self.buffer_limit = buffer_limit
+        self._buffer: List[OutboxEntry] = []
+        self._buffer_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="notify")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {"enqueued": 0, "delivered": 0, "batches": 0, "failed": 0, "dead": 0, "saturated": 0}
+
+    def sinks(self) -> Dict[str, NotificationSink]:
+        return {
+            name: handler
+            for name, handler in self.registry.services.items()
+            if name.startswith(NOTIFICATION_SINK_PREFIX)
+        }
+
+    def handle_event(self, event: StoreEvent) -> None:
+        if event.type not in NOTIFY_EVENTS:
+            return
+        if event.record.get("actor_type") in HUMAN_ACTOR_TYPES:
+            return
+        sinks = list(self.sinks())
+        if not sinks:
+            return
+        payload = {
+            "event": event.type,
+            "id": event.record["id"],
+            "task_id": event.record.get("task_id"),
+            "agent_role": event.record.get("agent_role") or event.agent_role,
+            "at": event.at,
+        }
+        with self._buffer_lock:
+            self._buffer.append((sinks, event.user_id, payload, time.time()))
+            full = len(self._buffer) >= self.buffer_limit
+        self._count("enqueued", len(sinks))
+        if full:
+            self._count("saturated")
+            self.write_buffer()
+
+    def write_buffer(self) -> int:
+        """Move buffered notifications into the outbox; returns the number of entries written."""
+        with self._buffer_lock:
+            entries, self._buffer = self._buffer, []
+        if entries:
+            self.outbox.add(entries)
+        return len(entries)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="notify-dispatch", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout)
+        self.flush()
+
+    def flush(self) -> int:
+        """Deliver everything currently due; returns the number of rows claimed."""
+        self.write_buffer()
+        rows = self.outbox.claim(time.time(), self.claim_limit, self.lease_seconds)
+        if not rows:
+            return 0
+        sinks = self.sinks()
+        batches: Dict[Tuple[str, str], List[OutboxRow]] = {}
+        for row in rows:
+            batches.setdefault((row[1], row[2]), []).append(row)
+        futures = []
+        for (sink_name, recipient), group in batches.items():
+            for start in range(0, len(group), self.batch_size):
+                chunk = group[start : start + self.batch_size]
+                sink = sinks.get(sink_name)
+                futures.append(self._executor.submit(self._deliver, sink, sink_name, recipient, chunk))
+        wait(futures)
+        return len(rows)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(self.outbox.counts())
+        with self._buffer_lock:
+            stats["buffered"] = len(self._buffer)
+        return stats
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.window_seconds):
+            try:
+                while self.flush() >= self.claim_limit:
+                    pass
+            except Exception:
+                logger.exception("Notification dispatch failed")
+
+    def _deliver(self, sink: Optional[NotificationSink], sink_name: str, recipient: str, rows: List[OutboxRow]) -> None:
+        ids = [row[0] for row in rows]
+        try:
+            if sink is None:
+                raise LookupError(f"Notification sink {sink_name} is not registered")
+            sink(recipient, [row[3] for row in rows])
+        except Exception:
+            logger.exception("Notification sink {} failed for {}", sink_name, recipient)
+            self._count("failed", len(rows))
+            now = time.time()
+            dead = [row[0] for row in rows if row[4] + 1 >= self.max_attempts]
+            retry = [
+                (row[0], now + self.retry_base_seconds * 2 ** row[4])
+                for row in rows
+                if row[4] + 1 < self.max_attempts
+            ]
+            if dead:
+                self.outbox.bury(dead)
+                self._count("dead", len(dead))
+            if retry:
+                self.outbox.retry(retry)
+            return
+        self.outbox.ack(ids)
+        self._count("batches")
+        self._count("delivered", len(rows))
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
@@ -0,0 +1,202 @@
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..config import PluginConfig
+from .registry import PluginRegistry, RegisteredHook
+from .runtime import PluginBlocked
+
+
+DEFAULT_TIMEOUT_SECONDS = 5.0
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_WORKERS = 8
+DEFAULT_AFTER_WORKERS = 2
+
+
+class HookTimeout(PluginBlocked):
+    def __init__(self, name: str, hook: RegisteredHook):
+        owner = hook.plugin_id or "anonymous"
+        super().__init__(f"Hook {name} ({owner}) timed out", status_code=504)
+
+
+class _HookCall:
+    """A hook submitted to an executor. Its timeout starts when a worker picks it up."""
+
+    def __init__(self, executor: ThreadPoolExecutor, hook: RegisteredHook, payload: Dict[str, Any], timeout: float):
+        self.hook = hook
+        self.timeout = timeout
+        self.queued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.future: Future = executor.submit(self._run, payload)
+
+    def _run(self, payload: Dict[str, Any]) -> None:
+        self.started_at = time.monotonic()
+        self.hook(payload)
+
+    def deadline(self) -> float:
+        # Waiting for a free worker gets its own allowance of one timeout.
+        return (self.started_at if self.started_at is not None else self.queued_at) + self.timeout
+
+
+class HookPipeline:
+    """Runs plugin hooks with per-hook timeouts.
+
+    ``run`` executes ``before_*`` hooks on the request path: hooks registered
+    with ``independent=True`` start together and overlap with the ordered ones,
+    and the first ``PluginBlocked`` cancels whatever has not finished yet.
+    ``dispatch`` hands ``after_*`` hooks to a bounded background queue; when the
+    queue is full the caller runs them inline so memory stays bounded.
+    After-hooks run on their own executor, so a stuck one cannot take worker
+    threads away from the request path.
+    """
+
+    def __init__(
+        self,
+        registry: PluginRegistry,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        after_workers: int = DEFAULT_AFTER_WORKERS,
+    ) -> None:
+        self.registry = registry
+        self.timeout_seconds = timeout_seconds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hook")
+        self._after_executor = ThreadPoolExecutor(max_workers=after_workers, thread_name_prefix="hook-after-run")
+        self._queue: "queue.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = queue.Queue(maxsize=queue_size)
+        self._after_workers = after_workers
+        self._consumers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._stats = {"dispatched": 0, "completed": 0, "failed": 0, "timed_out": 0, "saturated": 0}
+
+    @classmethod
+    def from_config(cls, registry: PluginRegistry, config: PluginConfig) -> "HookPipeline":
+        hooks = config.hooks
+        return cls(
+            registry,
+            timeout_seconds=float(hooks.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)),
+            queue_size=int(hooks.get("queue_size", DEFAULT_QUEUE_SIZE)),
+            workers=int(hooks.get("workers", DEFAULT_WORKERS)),
+            after_workers=int(hooks.get("after_workers", DEFAULT_AFTER_WORKERS)),
+        )
+
+    def run(self, name: str, payload: Dict[str, Any]) -> None:
+        hooks = self.registry.hooks.get(name)
+        if not hooks:
+            return
+        pending = [self._submit(self._executor, hook, payload) for hook in hooks if hook.independent]
+        try:
+            for hook in hooks:
+                if not hook.independent:
+                    # Watch the independent calls too, so one that blocks stops the ordered chain.
+                    self._await(name, [], watched=pending)
+                    self._await(name, [self._submit(self._executor, hook, payload)], watched=pending)
+            self._await(name, pending)
+        finally:
+            for call in pending:
+                call.future.cancel()
+
+    def dispatch(self, name: str, payload: Dict[str, Any]) -> None:
+        if not self.registry.hooks.get(name):
+            return
+        self._ensure_consumers()
+        try:
+            self._queue.put_nowait((name, payload))
+        except queue.Full:
+            self._count("saturated")
+            self._run_after(name, payload)
+            return
+        self._count("dispatched")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        stats["capacity"] = self._queue.maxsize
+        return stats
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            consumers, self._consumers = self._consumers, []
+        for _ in consumers:
+            self._queue.put(None)
+        for consumer in consumers:
+            consumer.join(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._after_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _timeout_for(self, hook: RegisteredHook) -> float:
+        if hook.timeout_seconds is not None:
+            return hook.timeout_seconds
+        return self.timeout_seconds
+
+    def _submit(self, executor: ThreadPoolExecutor, hook: RegisteredHook, payload: Dict[str, Any]) -> _HookCall:
+        return _HookCall(executor, hook, payload, self._timeout_for(hook))
+
+    def _await(self, name: str, calls: List[_HookCall], watched: Sequence[_HookCall] = ()) -> None:
+        """Wait for ``calls``; raise the first failure or timeout among ``calls`` and ``watched``."""
+        remaining = list(calls)
+        watched = list(watched)
+        try:
+            while True:
+                for call in [call for call in remaining + watched if call.future.done()]:
+                    if call in remaining:
+                        remaining.remove(call)
+                    else:
+                        watched.remove(call)
+                    call.future.result()
+                if not remaining:
+                    return
+                now = time.monotonic()
+                expired = [call for call in remaining + watched if call.deadline() <= now]
+                if expired:
+                    raise HookTimeout(name, expired[0].hook)
+                wait(
+                    [call.future for call in remaining + watched],
+                    timeout=min(call.deadline() for call in remaining + watched) - now,
+                    return_when=FIRST_EXCEPTION,
+                )
+        finally:
+            for call in remaining:
+                call.future.cancel()
+
+    def _ensure_consumers(self) -> None:
+        if self._consumers:
+            return
+        with self._lock:
+            if self._consumers:
+                return
+            for index in range(self._after_workers):
+                consumer = threading.Thread(target=self._consume, name=f"hook-after-{index}", daemon=True)
+                consumer.start()
+                self._consumers.append(consumer)
+
+    def _consume(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._run_after(*item)
+            finally:
+                self._queue.task_done()
+
+    def _run_after(self, name: str, payload: Dict[str, Any]) -> None:
+        for hook in self.registry.hooks.get(name, []):
+            try:
+                self._await(name, [self._submit(self._after_executor, hook, payload)])
+            except HookTimeout:
+                self._count("timed_out")
+                logger.warning("Hook {} ({}) timed out", name, hook.plugin_id)
+            except Exception:
+                self._count("failed")
+                logger.exception("Hook {} ({}) failed", name, hook.plugin_id)
+            else:
+                self._count("completed")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
@@ -9,6 +9,8 @@ from ..config import AppConfig
 from .manifest import PluginManifest, load_manifest
 from .registry import PluginRegistry
 from .runtime import PluginRuntime
+from .sandbox import DEFAULT_TIMEOUT_SECONDS, DEFAULT_WORKERS, SandboxPool, SandboxSpec
+from .schema import validate_plugin_config
 
 
 MANIFEST_FILENAME = "openclaw.plugin.json"
@@ -19,6 +21,9 @@ class LoadedPlugin:
     manifest: PluginManifest
     register: Callable[[PluginRuntime], None]
     config: Dict[str, Any]
+    hook_timeout_seconds: Optional[float] = None
+    root: Optional[str] = None
+    isolation: Optional[str] = None
 
 
 def _load_entry_from_path(root: str, entry: str) -> Callable[[PluginRuntime], None]:
@@ -101,10 +106,11 @@ def load_plugins(config: AppConfig) -> PluginRegistry:
     candidates = []
     candidates.extend(_discover_local_plugins(config.plugins.load_paths))
     candidates.extend(_discover_local_plugins(config.plugin_paths))
+    local_count = len(candidates)
     candidates.extend(_discover_entrypoint_plugins())
 
     loaded_ids: Dict[str, LoadedPlugin] = {}
-    for _, manifest, register in candidates:
+    for index, (root, manifest, register) in enumerate(candidates):
         if manifest.id in loaded_ids:
             continue
 
@@ -122,14 +128,50 @@ def load_plugins(config: AppConfig) -> PluginRegistry:
             if slot_owner != manifest.id and slot_owner != "none":
                 continue
 
+        isolation = entry_cfg.get("isolation")
+        if isolation == "process" and index >= local_count:
+            raise ValueError(
+                f"Plugin {manifest.id}: isolation 'process' is only supported for local-path plugins, "
+                f"not entry point {root}"
+            )
+
+        hook_timeout = entry_cfg.get("hook_timeout_seconds")
         loaded_ids[manifest.id] = LoadedPlugin(
             manifest=manifest,
             register=register,
-            config=entry_cfg.get("config", {}),
+            config=validate_plugin_config(manifest, entry_cfg.get("config", {})),
+            hook_timeout_seconds=float(hook_timeout) if hook_timeout is not None else None,
+            root=root,
+            isolation=isolation,
         )
 
+    sandboxed: List[SandboxSpec] = []
     for plugin in loaded_ids.values():
-        runtime = PluginRuntime(registry=registry, config=plugin.config)
+        if plugin.isolation == "process":
+            sandboxed.append(
+                SandboxSpec(
+                    plugin_id=plugin.manifest.id,
+                    root=plugin.root or "",
+                    entry=plugin.manifest.entry,
+                    config=plugin.config,
+                    hook_timeout_seconds=plugin.hook_timeout_seconds,
+                )
+            )
+            continue
+        runtime = PluginRuntime(
+            registry=registry,
+            config=plugin.config,
+            plugin_id=plugin.manifest.id,
+            hook_timeout_seconds=plugin.hook_timeout_seconds,
+        )
         plugin.register(runtime)
 
+    if sandboxed:
+        pool = SandboxPool(
+            sandboxed,
+            workers=int(config.plugins.sandbox.get("workers", DEFAULT_WORKERS)),
+            timeout_seconds=float(config.plugins.sandbox.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)),
+        )
+        pool.register_into(registry)
+
     return registry
@@ -1,28 +1,55 @@
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Union
 
 
 Hook = Callable[[Dict[str, Any]], None]
 Tool = Dict[str, Any]
 Command = Callable[[Dict[str, Any]], Any]
 Service = Callable[[], None]
+# Services registered under the ``notifications.`` prefix are delivery sinks,
+# called as ``sink(recipient, batch)``.
+NotificationSink = Callable[[str, List[Dict[str, Any]]], None]
+
+
+@dataclass
+class RegisteredHook:
+    handler: Hook
+    plugin_id: Optional[str] = None
+    independent: bool = False
+    timeout_seconds: Optional[float] = None
+
+    def __call__(self, payload: Dict[str, Any]) -> None:
+        self.handler(payload)
 
 
 @dataclass
 class PluginRegistry:
-    hooks: Dict[str, List[Hook]] = field(default_factory=dict)
+    hooks: Dict[str, List[RegisteredHook]] = field(default_factory=dict)
     tools: Dict[str, Tool] = field(default_factory=dict)
     commands: Dict[str, Command] = field(default_factory=dict)
-    services: Dict[str, Service] = field(default_factory=dict)
+    services: Dict[str, Union[Service, NotificationSink]] = field(default_factory=dict)
+    sandbox: Optional[Any] = field(default=None, repr=False)
+    _tool_list: Optional[List[Tool]] = field(default=None, init=False, repr=False)
 
     def register_hook(self, name: str, handler: Hook) -> None:
+        if not isinstance(handler, RegisteredHook):
+            handler = RegisteredHook(handler=handler)
         self.hooks.setdefault(name, []).append(handler)
 
     def register_tool(self, name: str, tool: Tool) -> None:
         self.tools[name] = tool
+        self._tool_list = None
+
+    def tool_list(self) -> List[Tool]:
+        """Serializable tool definitions (handlers stripped), cached until the next registration."""
+        if self._tool_list is None:
+            self._tool_list = [
+                {key: value for key, value in tool.items() if not callable(value)} for tool in self.tools.values()
+            ]
+        return self._tool_list
 
     def register_command(self, name: str, handler: Command) -> None:
         self.commands[name] = handler
 
-    def register_service(self, name: str, handler: Service) -> None:
+    def register_service(self, name: str, handler: Union[Service, NotificationSink]) -> None:
         self.services[name] = handler
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from .registry import PluginRegistry
+from .registry import PluginRegistry, RegisteredHook
 
 
 class PluginBlocked(Exception):
@@ -14,9 +14,19 @@ class PluginBlocked(Exception):
 class PluginRuntime:
     registry: PluginRegistry
     config: Dict[str, Any]
-
-    def register_hook(self, name: str, handler) -> None:
-        self.registry.register_hook(name, handler)
+    plugin_id: Optional[str] = None
+    hook_timeout_seconds: Optional[float] = None
+
+    def register_hook(self, name: str, handler, independent: bool = False) -> None:
+        self.registry.register_hook(
+            name,
+            RegisteredHook(
+                handler=handler,
+                plugin_id=self.plugin_id,
+                independent=independent,
+                timeout_seconds=self.hook_timeout_seconds,
+            ),
+        )
 
     def register_tool(self, name: str, tool: Dict[str, Any]) -> None:
         self.registry.register_tool(name, tool)
@@ -0,0 +1,272 @@
+import multiprocessing
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from .registry import PluginRegistry, RegisteredHook
+from .runtime import PluginBlocked, PluginRuntime
+
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT_SECONDS = 30.0
+STARTUP_TIMEOUT_SECONDS = 30.0
+# Added to the hook pipeline's timeout for sandboxed hooks, so the sandbox's
+# own deadline fires first and kills the worker instead of leaving it stuck.
+PIPELINE_GRACE_SECONDS = 1.0
+
+
+@dataclass
+class SandboxSpec:
+    plugin_id: str
+    root: str
+    entry: str
+    config: Dict[str, Any]
+    hook_timeout_seconds: Optional[float] = None
+
+
+class SandboxCrashed(PluginBlocked):
+    def __init__(self, plugin_id: str, reason: str):
+        super().__init__(f"Plugin {plugin_id} sandbox {reason}", status_code=503)
+
+
+def _worker_main(conn: Connection, specs: List[SandboxSpec]) -> None:
+    from .loader import _load_entry_from_path
+
+    registries: Dict[str, PluginRegistry] = {}
+    summary: Dict[str, Dict[str, Any]] = {}
+    for spec in specs:
+        registry = PluginRegistry()
+        register = _load_entry_from_path(spec.root, spec.entry)
+        register(PluginRuntime(registry=registry, config=spec.config, plugin_id=spec.plugin_id))
+        registries[spec.plugin_id] = registry
+        summary[spec.plugin_id] = {
+            "hooks": {name: [hook.independent for hook in hooks] for name, hooks in registry.hooks.items()},
+            "tools": {
+                name: {key: value for key, value in tool.items() if key != "handler"}
+                for name, tool in registry.tools.items()
+            },
+            "handlers": [name for name, tool in registry.tools.items() if callable(tool.get("handler"))],
+            "commands": list(registry.commands),
+            "services": list(registry.services),
+        }
+    conn.send(summary)
+
+    while True:
+        try:
+            plugin_id, kind, name, index, payload = conn.recv()
+        except EOFError:
+            return
+        registry = registries[plugin_id]
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            if kind == "hook":
+                registry.hooks[name][index](payload)
+                outcome: Tuple[Any, ...] = ("ok", None)
+            elif kind == "tool":
+                outcome = ("ok", registry.tools[name]["handler"](payload))
+            elif kind == "command":
+                outcome = ("ok", registry.commands[name](payload))
+            else:
+                outcome = ("ok", registry.services[name](*payload))
+        except PluginBlocked as exc:
+            outcome = ("blocked", str(exc), exc.status_code)
+        except Exception as exc:
+            outcome = ("error", f"{exc.__class__.__name__}: {exc}")
+        conn.send(outcome + (time.perf_counter() - wall, time.process_time() - cpu))
+
+
+class _Worker:
+    def __init__(self, context: Any, specs: List[SandboxSpec]) -> None:
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child, specs), daemon=True)
+        self.process.start()
+        child.close()
+
+    def close(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(1)
+        self.conn.close()
+
+
+class SandboxPool:
+    """Runs selected plugins in a pool of spawned worker processes.
+
+    Each worker loads every isolated plugin. The host registers proxy hooks,
+    tool handlers, commands and services that pickle their arguments over a
+    pipe to an idle worker,
+    so CPU-heavy plugins run on other cores and never hold the API's GIL.
+    A worker that crashes or overruns its timeout is killed at once and
+    replaced in the background.
+    The pool records calls, errors, wall time, and worker CPU time per plugin.
+    """
+
+    def __init__(
+        self,
+        specs: List[SandboxSpec],
+        workers: int = DEFAULT_WORKERS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        self.specs = specs
+        self.size = max(1, workers)
+        self.timeout_seconds = timeout_seconds
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._restarts = 0
+        self._closed = False
+        self._stats: Dict[str, Dict[str, float]] = {
+            spec.plugin_id: {"calls": 0, "errors": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0}
+            for spec in specs
+        }
+
+    def start(self) -> Dict[str, Dict[str, Any]]:
+        summary: Dict[str, Dict[str, Any]] = {}
+        for _ in range(self.size):
+            worker = _Worker(self._context, self.specs)
+            summary = self._handshake(worker)
+            self._workers.append(worker)
+            self._idle.put(worker)
+        return summary
+
+    def register_into(self, registry: PluginRegistry) -> None:
+        """Start the workers and register proxies for everything the plugins registered."""
+        summary = self.start()
+        for spec in self.specs:
+            registered = summary[spec.plugin_id]
+            timeout = self._timeout_for(spec)
+            for name, flags in registered["hooks"].items():
+                for index, independent in enumerate(flags):
+                    proxy = self._proxy(spec.plugin_id, "hook", name, index, timeout)
+                    hook = RegisteredHook(
+                        proxy,
+                        spec.plugin_id,
+                        independent=independent,
+                        timeout_seconds=timeout + PIPELINE_GRACE_SECONDS,
+                    )
+                    registry.register_hook(name, hook)
+            for name, tool in registered["tools"].items():
+                tool = dict(tool)
+                if name in registered["handlers"]:
+                    tool["handler"] = self._proxy(spec.plugin_id, "tool", name, 0, None)
+                registry.register_tool(name, tool)
+            for name in registered["commands"]:
+                registry.register_command(name, self._proxy(spec.plugin_id, "command", name, 0, None))
+            for name in registered["services"]:
+                registry.register_service(name, self._service_proxy(spec.plugin_id, name))
+        registry.sandbox = self
+
+    def call(
+        self,
+        plugin_id: str,
+        kind: str,
+        name: str,
+        index: int,
+        payload: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        timeout = self.timeout_seconds if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise SandboxCrashed(plugin_id, "has no idle worker")
+        started = time.perf_counter()
+        try:
+            worker.conn.send((plugin_id, kind, name, index, payload))
+            if not worker.conn.poll(max(0.0, deadline - time.monotonic())):
+                self._discard(worker)
+                self._record(plugin_id, time.perf_counter() - started, 0.0, error=True)
+                raise SandboxCrashed(plugin_id, "timed out")
+            outcome = worker.conn.recv()
+        except (EOFError, OSError):
+            self._discard(worker)
+            self._record(plugin_id, time.perf_counter() - started, 0.0, error=True)
+            raise SandboxCrashed(plugin_id, "worker crashed")
+        self._idle.put(worker)
+
+        status, *rest = outcome
+        wall, cpu = rest[-2], rest[-1]
+        self._record(plugin_id, wall, cpu, error=status == "error")
+        if status == "blocked":
+            raise PluginBlocked(rest[0], status_code=rest[1])
+        if status == "error":
+            raise RuntimeError(f"Plugin {plugin_id} {kind} {name} failed: {rest[0]}")
+        return rest[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            plugins = {plugin_id: dict(values) for plugin_id, values in self._stats.items()}
+            return {"workers": self.size, "restarts": self._restarts, "plugins": plugins}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+    def _timeout_for(self, spec: SandboxSpec) -> float:
+        if spec.hook_timeout_seconds is not None:
+            return spec.hook_timeout_seconds
+        return self.timeout_seconds
+
+    def _proxy(self, plugin_id: str, kind: str, name: str, index: int, timeout: Optional[float]):
+        def proxy(payload: Dict[str, Any]) -> Any:
+            return self.call(plugin_id, kind, name, index, payload, timeout)
+
+        return proxy
+
+    def _service_proxy(self, plugin_id: str, name: str):
+        # Services take positional arguments (notification sinks get recipient and batch).
+        def proxy(*args: Any) -> Any:
+            return self.call(plugin_id, "service", name, 0, list(args))
+
+        return proxy
+
+    def _handshake(self, worker: _Worker) -> Dict[str, Dict[str, Any]]:
+        if not worker.conn.poll(max(self.timeout_seconds, STARTUP_TIMEOUT_SECONDS)):
+            worker.close()
+            raise RuntimeError("Sandbox worker did not start in time")
+        try:
+            return worker.conn.recv()
+        except EOFError:
+            worker.close()
+            raise RuntimeError("Sandbox worker failed to load plugins")
+
+    def _discard(self, worker: _Worker) -> None:
+        logger.warning("Restarting sandbox worker pid={}", worker.process.pid)
+        worker.close()
+        with self._lock:
+            self._restarts += 1
+            self._workers = [w for w in self._workers if w is not worker]
+        threading.Thread(target=self._respawn, name="sandbox-respawn", daemon=True).start()
+
+    def _respawn(self) -> None:
+        try:
+            replacement = _Worker(self._context, self.specs)
+            self._handshake(replacement)
+        except Exception:
+            logger.exception("Sandbox worker failed to restart")
+            return
+        with self._lock:
+            if not self._closed:
+                self._workers.append(replacement)
+                self._idle.put(replacement)
+                return
+        replacement.close()
+
+    def _record(self, plugin_id: str, wall: float, cpu: float, error: bool) -> None:
+        with self._lock:
+            stats = self._stats[plugin_id]
+            stats["calls"] += 1
+            stats["wall_seconds"] += wall
+            stats["cpu_seconds"] += cpu
+            if error:
+                stats["errors"] += 1
@@ -0,0 +1,210 @@
+import copy
+import hashlib
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from .manifest import PluginManifest
+
+
+Validator = Callable[[Any, str], Any]
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+_BOOL_STRINGS = {"true": True, "false": False, "1": True, "0": False, "yes": True, "no": False}
+
+# Keywords the subset enforces, plus annotations that carry no constraint.
+# Anything else is rejected so a manifest cannot rely on a check that never runs.
+_SUPPORTED_KEYWORDS = {
+    "type", "enum", "minimum", "maximum", "minLength", "maxLength", "minItems", "maxItems",
+    "items", "properties", "required", "additionalProperties", "default",
+}
+_ANNOTATION_KEYWORDS = {
+    "$schema", "$id", "$comment", "title", "description", "examples", "deprecated", "readOnly", "writeOnly",
+}
+
+_compiled: Dict[str, Validator] = {}
+_validated: Dict[str, Dict[str, Any]] = {}
+
+
+class ConfigSchemaError(ValueError):
+    pass
+
+
+def _digest(value: Any) -> str:
+    raw = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _coerce(value: Any, type_name: str) -> Any:
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    try:
+        if type_name == "integer":
+            return int(text)
+        if type_name == "number":
+            return float(text) if any(c in text for c in ".eE") else int(text)
+    except ValueError:
+        return value
+    if type_name == "boolean" and text.lower() in _BOOL_STRINGS:
+        return _BOOL_STRINGS[text.lower()]
+    return value
+
+
+def _compile_type(types: List[str]) -> Validator:
+    for type_name in types:
+        if type_name not in _TYPE_CHECKS:
+            raise ConfigSchemaError(f"Unsupported schema type: {type_name}")
+    checks = [(t, _TYPE_CHECKS[t]) for t in types]
+    expected = " or ".join(types)
+
+    def check(value: Any, path: str) -> Any:
+        for _, matches in checks:
+            if matches(value):
+                return value
+        for type_name, matches in checks:
+            coerced = _coerce(value, type_name)
+            if coerced is not value and matches(coerced):
+                return coerced
+        raise ConfigSchemaError(f"{path}: expected {expected}")
+
+    return check
+
+
+def _compile_length(kind: type, min_len: Optional[int], max_len: Optional[int]) -> Validator:
+    def check_length(value: Any, path: str) -> Any:
+        if isinstance(value, kind):
+            if min_len is not None and len(value) < min_len:
+                raise ConfigSchemaError(f"{path}: length must be >= {min_len}")
+            if max_len is not None and len(value) > max_len:
+                raise ConfigSchemaError(f"{path}: length must be <= {max_len}")
+        return value
+
+    return check_length
+
+
+def _compile(schema: Dict[str, Any], where: str = "schema") -> Validator:
+    unsupported = sorted(set(schema) - _SUPPORTED_KEYWORDS - _ANNOTATION_KEYWORDS)
+    if unsupported:
+        raise ConfigSchemaError(f"{where}: unsupported schema keyword(s): {', '.join(unsupported)}")
+    steps: List[Validator] = []
+
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        steps.append(_compile_type(types))
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value: Any, path: str) -> Any:
+            if value not in allowed:
+                raise ConfigSchemaError(f"{path}: must be one of {allowed}")
+            return value
+
+        steps.append(check_enum)
+
+    minimum, maximum = schema.get("minimum"), schema.get("maximum")
+    if minimum is not None or maximum is not None:
+
+        def check_range(value: Any, path: str) -> Any:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                if minimum is not None and value < minimum:
+                    raise ConfigSchemaError(f"{path}: must be >= {minimum}")
+                if maximum is not None and value > maximum:
+                    raise ConfigSchemaError(f"{path}: must be <= {maximum}")
+            return value
+
+        steps.append(check_range)
+
+    for min_key, max_key, kind in (("minLength", "maxLength", str), ("minItems", "maxItems", list)):
+        if min_key in schema or max_key in schema:
+            steps.append(_compile_length(kind, schema.get(min_key), schema.get(max_key)))
+
+    if "items" in schema:
+        item_validator = _compile(schema["items"], f"{where}.items")
+
+        def check_items(value: Any, path: str) -> Any:
+            if not isinstance(value, list):
+                return value
+            return [item_validator(item, f"{path}[{i}]") for i, item in enumerate(value)]
+
+        steps.append(check_items)
+
+    if "properties" in schema or "required" in schema or "additionalProperties" in schema:
+        properties = {
+            key: _compile(sub, f"{where}.properties.{key}") for key, sub in schema.get("properties", {}).items()
+        }
+        defaults = {
+            key: sub["default"] for key, sub in schema.get("properties", {}).items() if "default" in sub
+        }
+        required = list(schema.get("required", []))
+        additional = schema.get("additionalProperties", True)
+        additional_validator = (
+            _compile(additional, f"{where}.additionalProperties") if isinstance(additional, dict) else None
+        )
+
+        def check_object(value: Any, path: str) -> Any:
+            if not isinstance(value, dict):
+                return value
+            result: Dict[str, Any] = {}
+            for key in required:
+                if key not in value and key not in defaults:
+                    raise ConfigSchemaError(f"{path}.{key}: is required")
+            for key, item in value.items():
+                validator = properties.get(key, additional_validator)
+                if validator is not None:
+                    result[key] = validator(item, f"{path}.{key}")
+                elif additional is not False:
+                    result[key] = item
+                else:
+                    raise ConfigSchemaError(f"{path}.{key}: unknown property")
+            for key, default in defaults.items():
+                if key not in result:
+                    result[key] = copy.deepcopy(default)
+            return result
+
+        steps.append(check_object)
+
+    def validate(value: Any, path: str) -> Any:
+        for step in steps:
+            value = step(value, path)
+        return value
+
+    return validate
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    key = _digest(schema)
+    validator = _compiled.get(key)
+    if validator is None:
+        validator = _compile(schema)
+        _compiled[key] = validator
+    return validator
+
+
+def validate_plugin_config(manifest: PluginManifest, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate and normalize a plugin's config against its manifest schema.
+
+    Results are cached by manifest schema and config digest, so reloading the
+    same configuration (or a forked worker inheriting the cache) skips
+    revalidation. Callers get a copy they are free to mutate.
+    """
+    if not manifest.config_schema:
+        return dict(config)
+    key = _digest([manifest.id, manifest.version, manifest.config_schema, config])
+    normalized = _validated.get(key)
+    if normalized is None:
+        try:
+            normalized = compile_schema(manifest.config_schema)(config, "config")
+        except ConfigSchemaError as exc:
+            raise ConfigSchemaError(f"Invalid config for plugin {manifest.id}: {exc}") from exc
+        _validated[key] = normalized
+    return copy.deepcopy(normalized)
@@ -0,0 +1,73 @@
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+
+CacheKey = Tuple[str, Optional[str]]
+
+
+class ResponseCache:
+    """Pre-serialized JSON bodies for hot read endpoints, tagged by version.
+
+    ETags are derived from a process boot id (plugins are only loaded at
+    startup, so unscoped entries change on restart) and, for user-scoped
+    entries, the user's version (bumped on store writes). A matching
+    ``If-None-Match`` is answered with 304 from the version counters alone,
+    before the body is built or looked up.
+    """
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self.max_entries = max_entries
+        self._boot = uuid.uuid4().hex[:12]
+        self._user_versions: Dict[str, int] = {}
+        self._entries: "OrderedDict[CacheKey, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bump_user(self, user_id: str) -> None:
+        with self._lock:
+            self._user_versions[user_id] = self._user_versions.get(user_id, 0) + 1
+
+    def etag(self, user_id: Optional[str] = None) -> str:
+        if user_id is None:
+            return f'W/"{self._boot}"'
+        return f'W/"{self._boot}-{self._user_versions.get(user_id, 0)}"'
+
+    def respond(
+        self,
+        request: Request,
+        key: str,
+        build: Callable[[], Any],
+        user_id: Optional[str] = None,
+    ) -> Response:
+        etag = self.etag(user_id)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if _matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        cache_key = (key, user_id)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] == etag:
+                self._entries.move_to_end(cache_key)
+                body = entry[1]
+            else:
+                body = None
+        if body is None:
+            body = json.dumps(build(), separators=(",", ":")).encode("utf-8")
+            with self._lock:
+                self._entries[cache_key] = (etag, body)
+                self._entries.move_to_end(cache_key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in tags or etag[2:] in tags
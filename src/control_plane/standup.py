@@ -0,0 +1,97 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .store import StoreEvent
+
+
+@dataclass
+class UserRollup:
+    counts_by_status: Dict[str, int] = field(default_factory=dict)
+    messages_per_task: Dict[str, int] = field(default_factory=dict)
+    documents_per_task: Dict[str, int] = field(default_factory=dict)
+    last_activity: Dict[str, float] = field(default_factory=dict)
+    tasks: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    touched: "OrderedDict[str, float]" = field(default_factory=OrderedDict)
+
+
+class StandupRollups:
+    """Per-user standup aggregates maintained from store events.
+
+    Every create and status change updates the counters in O(1) and moves
+    the task to the end of the user's ``touched`` order, so a summary walks
+    back from the most recent task and stops at the window start. It never
+    revisits older history.
+    """
+
+    def __init__(self) -> None:
+        self._users: Dict[str, UserRollup] = {}
+        self._lock = threading.Lock()
+
+    def handle_event(self, event: StoreEvent) -> None:
+        record = event.record
+        with self._lock:
+            rollup = self._users.setdefault(event.user_id, UserRollup())
+            if event.type == "task.created":
+                task_id = record["id"]
+                rollup.tasks[task_id] = record
+                _bump(rollup.counts_by_status, record["status"], 1)
+            elif event.type == "task.updated":
+                task_id = record["id"]
+                _bump(rollup.counts_by_status, (event.previous or {}).get("status"), -1)
+                _bump(rollup.counts_by_status, record["status"], 1)
+            elif event.type in ("message.created", "document.created"):
+                task_id = record["task_id"]
+                if task_id not in rollup.tasks:
+                    # Messages and documents may name any task id; only count the user's own tasks.
+                    return
+                counts = rollup.messages_per_task if event.type == "message.created" else rollup.documents_per_task
+                _bump(counts, task_id, 1)
+            else:
+                return
+            rollup.touched[task_id] = event.at
+            rollup.touched.move_to_end(task_id)
+            agent_role = event.agent_role or record.get("agent_role")
+            if agent_role:
+                rollup.last_activity[agent_role] = event.at
+
+    def summary(self, user_id: str, since: float, until: Optional[float] = None) -> Dict[str, Any]:
+        until = time.time() if until is None else until
+        with self._lock:
+            rollup = self._users.get(user_id) or UserRollup()
+            tasks: List[Dict[str, Any]] = []
+            for task_id, touched_at in reversed(rollup.touched.items()):
+                if touched_at < since:
+                    break
+                if touched_at > until:
+                    continue
+                task = rollup.tasks.get(task_id, {})
+                tasks.append(
+                    {
+                        "id": task_id,
+                        "title": task.get("title"),
+                        "status": task.get("status"),
+                        "messages": rollup.messages_per_task.get(task_id, 0),
+                        "documents": rollup.documents_per_task.get(task_id, 0),
+                        "last_activity": touched_at,
+                    }
+                )
+            return {
+                "since": since,
+                "until": until,
+                "counts_by_status": dict(rollup.counts_by_status),
+                "last_activity": dict(rollup.last_activity),
+                "tasks": tasks,
+            }
+
+
+def _bump(counts: Dict[str, int], key: Optional[str], amount: int) -> None:
+    if key is None:
+        return
+    value = counts.get(key, 0) + amount
+    if value:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
@@ -1,7 +1,27 @@
 import hashlib
 import json
-import uuid
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from .ids import new_id
+
+
+@dataclass
+class StoreEvent:
+    type: str
+    user_id: str
+    record: Dict[str, Any]
+    agent_role: Optional[str] = None
+    previous: Optional[Dict[str, Any]] = None
+    at: float = field(default_factory=time.time)
+
+
+Listener = Callable[[StoreEvent], None]
 
 
 def hash_payload(payload: Any) -> str:
@@ -14,16 +34,36 @@ class InMemoryStore:
         self.tasks: List[Dict[str, Any]] = []
         self.messages: List[Dict[str, Any]] = []
         self.documents: List[Dict[str, Any]] = []
+        self.task_index: Dict[str, Dict[str, Any]] = {}
+        self.tasks_by_user: Dict[str, Tuple[List[str], List[Dict[str, Any]]]] = {}
         self.idempotency: Dict[str, Dict[str, Tuple[str, Dict[str, Any]]]] = {
             "tasks": {},
             "messages": {},
             "documents": {},
         }
+        self.listeners: List[Listener] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener: Listener) -> None:
+        self.listeners.append(listener)
 
-    def list_tasks(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
-        return [t for t in self.tasks if t["user_id"] == user_id][:limit]
+    def _emit(self, event: StoreEvent) -> None:
+        for listener in self.listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Store listener failed for {}", event.type)
 
-    def create_task(self, user_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def list_tasks(self, user_id: str, limit: int, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Tasks in id (creation) order, starting after the ``after`` cursor."""
+        with self._lock:
+            ids, tasks = self.tasks_by_user.get(user_id, ([], []))
+            start = bisect_right(ids, after) if after else 0
+            return tasks[start : start + limit]
+
+    def create_task(
+        self, user_id: str, payload: Dict[str, Any], agent_role: Optional[str] = None
+    ) -> Dict[str, Any]:
         key = payload.get("idempotency_key")
         if key:
             record = self.idempotency["tasks"].get(key)
@@ -32,20 +72,43 @@ class InMemoryStore:
                 if record[0] != req_hash:
                     raise ValueError("idempotency_key conflict")
                 return record[1]
-        task = {
-            "id": str(uuid.uuid4()),
-            "user_id": user_id,
-            "title": payload["title"],
-            "status": payload.get("status", "in_progress"),
-            "description": payload.get("description"),
-            "metadata": payload.get("metadata"),
-        }
-        self.tasks.append(task)
-        if key:
-            self.idempotency["tasks"][key] = (hash_payload(payload), task)
+        with self._lock:
+            # Ids are monotonic per process, so appending under the lock keeps each
+            # user's index sorted for cursor paging.
+            task = {
+                "id": new_id(),
+                "user_id": user_id,
+                "title": payload["title"],
+                "status": payload.get("status", "in_progress"),
+                "description": payload.get("description"),
+                "metadata": payload.get("metadata"),
+            }
+            self.tasks.append(task)
+            self.task_index[task["id"]] = task
+            ids, tasks = self.tasks_by_user.setdefault(user_id, ([], []))
+            ids.append(task["id"])
+            tasks.append(task)
+            if key:
+                self.idempotency["tasks"][key] = (hash_payload(payload), task)
+        self._emit(StoreEvent("task.created", user_id, task, agent_role))
+        return task
+
+    def update_task_status(
+        self, user_id: str, task_id: str, status: str, agent_role: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        task = self.task_index.get(task_id)
+        if not task or task["user_id"] != user_id:
+            return None
+        previous = task["status"]
+        if previous == status:
+            return task
+        task["status"] = status
+        self._emit(StoreEvent("task.updated", user_id, task, agent_role, previous={"status": previous}))
         return task
 
-    def create_message(self, user_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def create_message(
+        self, user_id: str, payload: Dict[str, Any], agent_role: Optional[str] = None
+    ) -> Dict[str, Any]:
         key = payload.get("idempotency_key")
         if key:
             record = self.idempotency["messages"].get(key)
@@ -55,7 +118,7 @@ class InMemoryStore:
                     raise ValueError("idempotency_key conflict")
                 return record[1]
         message = {
-            "id": str(uuid.uuid4()),
+            "id": new_id(),
             "user_id": user_id,
             "task_id": payload["task_id"],
             "content": payload["content"],
@@ -66,9 +129,12 @@ class InMemoryStore:
         self.messages.append(message)
         if key:
             self.idempotency["messages"][key] = (hash_payload(payload), message)
+        self._emit(StoreEvent("message.created", user_id, message, agent_role))
         return message
 
-    def create_document(self, user_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def create_document(
+        self, user_id: str, payload: Dict[str, Any], agent_role: Optional[str] = None
+    ) -> Dict[str, Any]:
         key = payload.get("idempotency_key")
         if key:
             record = self.idempotency["documents"].get(key)
@@ -78,7 +144,7 @@ class InMemoryStore:
                     raise ValueError("idempotency_key conflict")
                 return record[1]
         document = {
-            "id": str(uuid.uuid4()),
+            "id": new_id(),
             "user_id": user_id,
             "task_id": payload["task_id"],
             "title": payload["title"],
@@ -88,4 +154,5 @@ class InMemoryStore:
         self.documents.append(document)
         if key:
             self.idempotency["documents"][key] = (hash_payload(payload), document)
+        self._emit(StoreEvent("document.created", user_id, document, agent_role))
         return document
@@ -0,0 +1,249 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .ids import new_id
+
+
+FINISHED = ("done", "failed")
+
+
+class LeaseError(Exception):
+    pass
+
+
+@dataclass
+class ToolRequest:
+    id: str
+    user_id: str
+    tool: str
+    arguments: Dict[str, Any]
+    priority: int = 0
+    status: str = "queued"
+    attempts: int = 0
+    result: Any = None
+    error: Optional[str] = None
+    worker_id: Optional[str] = None
+    lease_token: Optional[str] = None
+    lease_expires: float = 0.0
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def public(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "tool": self.tool,
+            "status": self.status,
+            "priority": self.priority,
+            "attempts": self.attempts,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+    def leased(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "tool": self.tool,
+            "arguments": self.arguments,
+            "attempts": self.attempts,
+            "lease_token": self.lease_token,
+        }
+
+
+class ToolRequestQueue:
+    """Per-user priority queue of tool requests leased by local workers.
+
+    Ready requests sit in a heap per user ordered by (-priority, sequence).
+    Leases go into a single heap ordered by expiry. Expired leases are
+    reclaimed lazily on lease, get and wait; a request whose lease runs out
+    ``max_attempts`` times is failed and its long-pollers are woken. Both
+    heaps drop stale entries lazily, so enqueue, lease and complete are
+    O(log n).
+    """
+
+    def __init__(
+        self,
+        visibility_timeout: float = 30.0,
+        max_attempts: int = 3,
+        result_ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.result_ttl = result_ttl
+        self._clock = clock
+        self._requests: Dict[str, ToolRequest] = {}
+        self._ready: Dict[str, List[Tuple[int, int, str]]] = {}
+        self._leases: List[Tuple[float, str, str]] = []
+        self._finished: Deque[Tuple[float, str]] = deque()
+        self._waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def enqueue(self, user_id: str, tool: str, arguments: Dict[str, Any], priority: int = 0) -> ToolRequest:
+        request = ToolRequest(id=new_id(), user_id=user_id, tool=tool, arguments=arguments, priority=priority)
+        with self._lock:
+            self._prune(self._clock())
+            self._requests[request.id] = request
+            self._push_ready(request)
+        return request
+
+    def lease(
+        self,
+        user_id: str,
+        worker_id: str,
+        max_items: int = 1,
+        visibility_timeout: Optional[float] = None,
+    ) -> List[ToolRequest]:
+        timeout = self.visibility_timeout if visibility_timeout is None else visibility_timeout
+        leased: List[ToolRequest] = []
+        finished: List[ToolRequest] = []
+        with self._lock:
+            now = self._clock()
+            finished = self._reclaim(now)
+            ready = self._ready.get(user_id)
+            while ready and len(leased) < max_items:
+                _, _, request_id = heapq.heappop(ready)
+                request = self._requests.get(request_id)
+                if request is None or request.status != "queued":
+                    continue
+                request.status = "leased"
+                request.worker_id = worker_id
+                request.lease_token = uuid.uuid4().hex
+                request.lease_expires = now + timeout
+                heapq.heappush(self._leases, (request.lease_expires, request.id, request.lease_token))
+                leased.append(request)
+        self._notify(finished)
+        return leased
+
+    def complete(
+        self,
+        user_id: str,
+        request_id: str,
+        lease_token: str,
+        result: Any = None,
+        error: Optional[str] = None,
+    ) -> ToolRequest:
+        with self._lock:
+            request = self._get(user_id, request_id)
+            if request is None:
+                raise KeyError(request_id)
+            if request.status != "leased" or request.lease_token != lease_token:
+                raise LeaseError("lease is no longer held")
+            self._finish(request, "failed" if error else "done", self._clock())
+            request.result = result
+            request.error = error
+        self._notify([request])
+        return request
+
+    def get(self, user_id: str, request_id: str) -> Optional[ToolRequest]:
+        with self._lock:
+            finished = self._reclaim(self._clock())
+            request = self._get(user_id, request_id)
+        self._notify(finished)
+        return request
+
+    async def wait(self, user_id: str, request_id: str, timeout: float) -> Optional[ToolRequest]:
+        """Long-poll until the request finishes or ``timeout`` elapses.
+
+        While the request is leased the poller also wakes at the lease expiry
+        and reclaims it, so a dead worker's request is retried or failed even
+        when no other queue call arrives.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            with self._lock:
+                now = self._clock()
+                finished = self._reclaim(now)
+                request = self._get(user_id, request_id)
+                remaining = deadline - loop.time()
+                if request is None or request.status in FINISHED or remaining <= 0:
+                    waiter = None
+                else:
+                    if request.status == "leased":
+                        remaining = min(remaining, max(0.0, request.lease_expires - now))
+                    waiter = (loop, loop.create_future())
+                    self._waiters.setdefault(request_id, []).append(waiter)
+            self._notify(finished)
+            if waiter is None:
+                return request
+            try:
+                await asyncio.wait_for(waiter[1], remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    waiters = self._waiters.get(request_id, [])
+                    if waiter in waiters:
+                        waiters.remove(waiter)
+                    if not waiters:
+                        self._waiters.pop(request_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counts: Dict[str, int] = {"queued": 0, "leased": 0, "done": 0, "failed": 0}
+            for request in self._requests.values():
+                counts[request.status] += 1
+        return counts
+
+    def _get(self, user_id: str, request_id: str) -> Optional[ToolRequest]:
+        request = self._requests.get(request_id)
+        if request is None or request.user_id != user_id:
+            return None
+        return request
+
+    def _push_ready(self, request: ToolRequest) -> None:
+        ready = self._ready.setdefault(request.user_id, [])
+        heapq.heappush(ready, (-request.priority, next(self._seq), request.id))
+
+    def _reclaim(self, now: float) -> List[ToolRequest]:
+        failed: List[ToolRequest] = []
+        while self._leases and self._leases[0][0] <= now:
+            _, request_id, token = heapq.heappop(self._leases)
+            request = self._requests.get(request_id)
+            if request is None or request.status != "leased" or request.lease_token != token:
+                continue
+            request.attempts += 1
+            request.lease_token = None
+            request.worker_id = None
+            if request.attempts >= self.max_attempts:
+                request.error = "lease expired"
+                self._finish(request, "failed", now)
+                failed.append(request)
+            else:
+                request.status = "queued"
+                self._push_ready(request)
+        return failed
+
+    def _finish(self, request: ToolRequest, status: str, now: float) -> None:
+        request.status = status
+        request.lease_token = None
+        request.finished_at = time.time()
+        self._finished.append((now, request.id))
+
+    def _prune(self, now: float) -> None:
+        while self._finished and self._finished[0][0] + self.result_ttl <= now:
+            _, request_id = self._finished.popleft()
+            self._requests.pop(request_id, None)
+
+    def _notify(self, requests: List[ToolRequest]) -> None:
+        for request in requests:
+            with self._lock:
+                waiters = self._waiters.pop(request.id, [])
+            for loop, future in waiters:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(_resolve, future)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,98 @@
+"""Local worker that leases queued tool requests and posts their results.
+
+Run next to the API with the same plugin configuration:
+
+    AGENT_TOKEN=... python -m control_plane.tool_worker
+
+The worker authenticates with ``AGENT_TOKEN`` and therefore serves the
+tool requests of that token's user.
+"""
+import json
+import os
+import socket
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from .config import load_config
+from .plugins.loader import load_plugins
+from .plugins.registry import PluginRegistry
+
+
+class ToolWorker:
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        registry: PluginRegistry,
+        worker_id: Optional[str] = None,
+        batch_size: int = 4,
+        idle_seconds: float = 0.5,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.registry = registry
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.batch_size = batch_size
+        self.idle_seconds = idle_seconds
+
+    def run_once(self) -> int:
+        lease = {"worker_id": self.worker_id, "max_items": self.batch_size}
+        items: List[Dict[str, Any]] = self._post("/api/tool-requests/lease", lease)["items"]
+        for item in items:
+            body: Dict[str, Any] = {"lease_token": item["lease_token"]}
+            try:
+                body["result"] = self.execute(item["tool"], item["arguments"])
+            except Exception as exc:
+                logger.exception("Tool {} failed", item["tool"])
+                body["error"] = str(exc) or exc.__class__.__name__
+            try:
+                self._post(f"/api/tool-requests/{item['id']}/result", body)
+            except urllib.error.HTTPError as exc:
+                if exc.code != 409:
+                    raise
+                logger.warning("Lease on {} expired before completion", item["id"])
+        return len(items)
+
+    def execute(self, name: str, arguments: Dict[str, Any]) -> Any:
+        tool = self.registry.tools.get(name)
+        handler = tool.get("handler") if tool else None
+        if handler is None:
+            raise LookupError(f"tool {name} has no handler")
+        return handler(arguments)
+
+    def run_forever(self) -> None:
+        logger.info("Tool worker {} polling {}", self.worker_id, self.base_url)
+        while True:
+            try:
+                if self.run_once():
+                    continue
+            except (urllib.error.URLError, OSError) as exc:
+                logger.warning("Tool worker poll failed: {}", exc)
+            time.sleep(self.idle_seconds)
+
+    def _post(self, path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps(body).encode("utf-8"),
+            headers={"Content-Type": "application/json", "X-Agent-Token": self.token},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read() or b"{}")
+
+
+def main() -> None:
+    cfg = load_config()
+    token = os.getenv("AGENT_TOKEN", "")
+    if not token:
+        raise SystemExit("AGENT_TOKEN is required")
+    base_url = os.getenv("CONTROL_PLANE_URL", f"http://127.0.0.1:{cfg.port}")
+    ToolWorker(base_url, token, load_plugins(cfg)).run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import gzip
+import json
+import os
+import sys
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append("src")
+os.environ["AGENT_JWT_SECRET"] = "test-secret"
+
+from control_plane.compression import supported_encodings  # noqa: E402
+from control_plane.main import app  # noqa: E402
+
+
+def _headers(**extra):
+    payload = {"type": "agent", "user_id": "user-compress", "agent_role": "jarvis"}
+    return {"X-Agent-Token": jwt.encode(payload, "test-secret", algorithm="HS256"), **extra}
+
+
+def test_gzip_request_and_response():
+    client = TestClient(app)
+    body = json.dumps({"task_id": "t1", "title": "Doc", "content": "lorem ipsum " * 500}).encode("utf-8")
+    created = client.post(
+        "/api/mission-control/documents",
+        headers=_headers(
+            **{"Content-Encoding": "gzip", "Content-Type": "application/json", "Accept-Encoding": "gzip"}
+        ),
+        content=gzip.compress(body),
+    )
+    assert created.status_code == 200
+    assert created.json()["content"].startswith("lorem ipsum")
+    assert created.headers["content-encoding"] == "gzip"
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
+
+
+def test_request_size_limits():
+    client = TestClient(app)
+    bomb = gzip.compress(b"0" * (6 * 1024 * 1024))
+    rejected = client.post(
+        "/api/mission-control/documents",
+        headers=_headers(**{"Content-Encoding": "gzip", "Content-Type": "application/json"}),
+        content=bomb,
+    )
+    assert rejected.status_code == 413
+
+    if "zstd" in supported_encodings():
+        import zstandard
+
+        zstd_bomb = zstandard.ZstdCompressor().compress(b"0" * (300 * 1024 * 1024))
+        rejected = client.post(
+            "/api/mission-control/documents",
+            headers=_headers(**{"Content-Encoding": "zstd", "Content-Type": "application/json"}),
+            content=zstd_bomb,
+        )
+        assert rejected.status_code == 413
+
+    unsupported = client.post(
+        "/api/mission-control/documents",
+        headers=_headers(**{"Content-Encoding": "br", "Content-Type": "application/json"}),
+        content=b"{}",
+    )
+    assert unsupported.status_code == 415
+
+
+def test_malformed_compressed_bodies():
+    client = TestClient(app)
+    body = gzip.compress(json.dumps({"task_id": "t1", "content": "hello"}).encode("utf-8"))
+    for content in (body[:-8], body + b"trailing"):
+        response = client.post(
+            "/api/mission-control/messages",
+            headers=_headers(**{"Content-Encoding": "gzip", "Content-Type": "application/json"}),
+            content=content,
+        )
+        assert response.status_code == 400
+
+
+def test_zstd_request():
+    zstandard = pytest.importorskip("zstandard")
+    client = TestClient(app)
+    body = json.dumps({"task_id": "t1", "content": "hello"}).encode("utf-8")
+    created = client.post(
+        "/api/mission-control/messages",
+        headers=_headers(**{"Content-Encoding": "zstd", "Content-Type": "application/json"}),
+        content=zstandard.ZstdCompressor().compress(body),
+    )
+    assert created.status_code == 200
+    assert created.json()["content"] == "hello"
+
+    truncated = client.post(
+        "/api/mission-control/messages",
+        headers=_headers(**{"Content-Encoding": "zstd", "Content-Type": "application/json"}),
+        content=zstandard.ZstdCompressor().compress(body)[:-4],
+    )
+    assert truncated.status_code == 400
+
+
+def test_large_bodies_round_trip_off_the_event_loop():
+    client = TestClient(app)
+    content = os.urandom(100 * 1024).hex()
+    body = json.dumps({"task_id": "t1", "title": "Big", "content": content}).encode("utf-8")
+    created = client.post(
+        "/api/mission-control/documents",
+        headers=_headers(
+            **{"Content-Encoding": "gzip", "Content-Type": "application/json", "Accept-Encoding": "gzip"}
+        ),
+        content=gzip.compress(body),
+    )
+    assert created.status_code == 200
+    assert created.headers["content-encoding"] == "gzip"
+    assert created.json()["content"] == content
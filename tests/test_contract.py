@@ -55,3 +55,108 @@ def test_task_lifecycle():
         json={"task_id": task_id, "title": "Doc", "content": "Body"},
     )
     assert document.status_code == 200
+
+
+def test_heartbeat():
+    client = TestClient(app)
+    headers = {"X-Agent-Token": _token()}
+
+    beat = client.post("/api/mission-control/heartbeat", headers=headers)
+    assert beat.status_code == 200
+    assert beat.json()["agent_role"] == "jarvis"
+
+    live = client.get("/api/mission-control/heartbeat", headers=headers)
+    assert live.status_code == 200
+    assert [item["agent_role"] for item in live.json()["items"]] == ["jarvis"]
+
+
+def test_task_status_update_and_standup():
+    client = TestClient(app)
+    headers = {"X-Agent-Token": _token()}
+
+    create = client.post("/api/mission-control/tasks", headers=headers, json={"title": "Standup Task"})
+    task_id = create.json()["id"]
+
+    update = client.patch(f"/api/mission-control/tasks/{task_id}", headers=headers, json={"status": "done"})
+    assert update.status_code == 200
+    assert update.json()["status"] == "done"
+
+    missing = client.patch("/api/mission-control/tasks/missing", headers=headers, json={"status": "done"})
+    assert missing.status_code == 404
+
+    invalid = client.patch(f"/api/mission-control/tasks/{task_id}", headers=headers, json={"status": "whenever"})
+    assert invalid.status_code == 422
+
+    standup = client.get("/api/mission-control/standup", headers=headers)
+    assert standup.status_code == 200
+    body = standup.json()
+    assert body["counts_by_status"]["done"] >= 1
+    assert body["tasks"][0]["id"] == task_id
+
+
+def test_tool_request_queue():
+    client = TestClient(app)
+    headers = {"X-Agent-Token": _token()}
+
+    enqueue = client.post(
+        "/api/tool-requests",
+        headers=headers,
+        json={"tool": "echo", "arguments": {"message": "hi"}, "priority": 1},
+    )
+    assert enqueue.status_code == 202
+    request_id = enqueue.json()["id"]
+
+    lease = client.post("/api/tool-requests/lease", headers=headers, json={"worker_id": "w1"})
+    item = lease.json()["items"][0]
+    assert item["id"] == request_id
+
+    result = client.post(
+        f"/api/tool-requests/{request_id}/result",
+        headers=headers,
+        json={"lease_token": item["lease_token"], "result": {"message": "hi"}},
+    )
+    assert result.status_code == 200
+
+    fetched = client.get(f"/api/tool-requests/{request_id}?wait=1", headers=headers)
+    assert fetched.json()["status"] == "done"
+    assert fetched.json()["result"] == {"message": "hi"}
+
+
+def test_conditional_get_on_task_list():
+    client = TestClient(app)
+    headers = {"X-Agent-Token": _token()}
+
+    first = client.get("/api/mission-control/tasks", headers=headers)
+    etag = first.headers["ETag"]
+    cached = client.get("/api/mission-control/tasks", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    client.post("/api/mission-control/tasks", headers=headers, json={"title": "Invalidate"})
+    fresh = client.get("/api/mission-control/tasks", headers={**headers, "If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["ETag"] != etag
+    assert fresh.json()["items"][-1]["title"] == "Invalidate"
+
+    tools = client.get("/api/tools", headers=headers)
+    assert tools.status_code == 200
+    assert all("handler" not in tool for tool in tools.json()["tools"])
+
+
+def test_task_list_cursor():
+    client = TestClient(app)
+    headers = {"X-Agent-Token": _token()}
+    for i in range(3):
+        client.post("/api/mission-control/tasks", headers=headers, json={"title": f"Page {i}"})
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"after": cursor} if cursor else {})}
+        page = client.get("/api/mission-control/tasks", headers=headers, params=params).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen))
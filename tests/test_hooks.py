@@ -0,0 +1,151 @@
+import sys
+import threading
+import time
+
+sys.path.append("src")
+
+from control_plane.plugins.hooks import HookPipeline, HookTimeout
+from control_plane.plugins.registry import PluginRegistry, RegisteredHook
+from control_plane.plugins.runtime import PluginBlocked
+
+
+def _sleeper(seconds: float):
+    def hook(payload):
+        time.sleep(seconds)
+
+    return hook
+
+
+def test_independent_hooks_run_concurrently():
+    registry = PluginRegistry()
+    for _ in range(4):
+        registry.register_hook("before_task_create", RegisteredHook(_sleeper(0.2), independent=True))
+    pipeline = HookPipeline(registry)
+    started = time.monotonic()
+    pipeline.run("before_task_create", {})
+    assert time.monotonic() - started < 0.6
+    pipeline.shutdown()
+
+
+def test_first_block_short_circuits():
+    registry = PluginRegistry()
+
+    def block(payload):
+        raise PluginBlocked("blocked")
+
+    registry.register_hook("before_message_post", RegisteredHook(_sleeper(2), independent=True))
+    registry.register_hook("before_message_post", RegisteredHook(block, independent=True))
+    pipeline = HookPipeline(registry)
+    started = time.monotonic()
+    try:
+        pipeline.run("before_message_post", {})
+        assert False, "expected PluginBlocked"
+    except PluginBlocked as exc:
+        assert str(exc) == "blocked"
+    assert time.monotonic() - started < 1
+    pipeline.shutdown()
+
+
+def test_independent_block_stops_ordered_hooks():
+    registry = PluginRegistry()
+    ran = []
+
+    def block(payload):
+        raise PluginBlocked("blocked")
+
+    def ordered(payload):
+        time.sleep(0.5)
+        ran.append(payload)
+
+    registry.register_hook("before_task_create", RegisteredHook(block, independent=True))
+    for _ in range(3):
+        registry.register_hook("before_task_create", ordered)
+    pipeline = HookPipeline(registry)
+    started = time.monotonic()
+    try:
+        pipeline.run("before_task_create", {})
+        assert False, "expected PluginBlocked"
+    except PluginBlocked as exc:
+        assert str(exc) == "blocked"
+    assert time.monotonic() - started < 0.4
+    time.sleep(0.7)
+    assert len(ran) <= 1
+    pipeline.shutdown()
+
+
+def test_hook_timeout():
+    registry = PluginRegistry()
+    registry.register_hook("before_task_create", RegisteredHook(_sleeper(1), plugin_id="slow", timeout_seconds=0.05))
+    pipeline = HookPipeline(registry)
+    try:
+        pipeline.run("before_task_create", {})
+        assert False, "expected HookTimeout"
+    except HookTimeout as exc:
+        assert exc.status_code == 504
+    pipeline.shutdown()
+
+
+def test_after_hooks_dispatch_in_background():
+    registry = PluginRegistry()
+    release = threading.Event()
+    seen = []
+
+    def hook(payload):
+        release.wait(1)
+        seen.append(payload["n"])
+
+    registry.register_hook("after_task_create", hook)
+    pipeline = HookPipeline(registry, queue_size=1, after_workers=1)
+    pipeline.dispatch("after_task_create", {"n": 1})
+    release.set()
+    pipeline.dispatch("after_task_create", {"n": 2})
+    pipeline.dispatch("after_task_create", {"n": 3})
+    pipeline.shutdown(timeout=2)
+    assert sorted(seen) == [1, 2, 3]
+    stats = pipeline.stats()
+    assert stats["dispatched"] + stats["saturated"] == 3
+    assert stats["completed"] == 3
+
+
+def test_stuck_after_hooks_do_not_starve_before_hooks():
+    registry = PluginRegistry()
+    release = threading.Event()
+    registry.register_hook(
+        "after_task_create", RegisteredHook(lambda payload: release.wait(5), plugin_id="stuck", timeout_seconds=0.05)
+    )
+    registry.register_hook("before_task_create", RegisteredHook(lambda payload: None, timeout_seconds=0.5))
+    pipeline = HookPipeline(registry, workers=2, after_workers=2, queue_size=2)
+    try:
+        for n in range(20):
+            pipeline.dispatch("after_task_create", {"n": n})
+        deadline = time.monotonic() + 5
+        while pipeline.stats()["timed_out"] < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = pipeline.stats()
+        assert stats["timed_out"] == 20
+        assert stats["dispatched"] + stats["saturated"] == 20
+        assert stats["completed"] == 0
+
+        # Every after-hook thread is still stuck; before-hooks must not notice.
+        for _ in range(5):
+            started = time.monotonic()
+            pipeline.run("before_task_create", {})
+            assert time.monotonic() - started < 0.1
+    finally:
+        release.set()
+        pipeline.shutdown(timeout=2)
+
+
+def test_timeout_excludes_time_waiting_for_a_worker():
+    registry = PluginRegistry()
+    for _ in range(2):
+        registry.register_hook(
+            "before_task_create", RegisteredHook(_sleeper(0.15), independent=True, timeout_seconds=0.25)
+        )
+    pipeline = HookPipeline(registry, workers=1)
+    started = time.monotonic()
+    pipeline.run("before_task_create", {})
+    elapsed = time.monotonic() - started
+    # One worker runs the hooks back to back: 0.3s in total, over each hook's 0.25s timeout.
+    assert 0.3 <= elapsed < 0.5
+    pipeline.shutdown()
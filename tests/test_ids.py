@@ -0,0 +1,65 @@
+import sys
+import threading
+import time
+import uuid
+
+sys.path.append("src")
+
+from control_plane.ids import floor_id, id_timestamp, new_id
+from control_plane.store import InMemoryStore
+
+
+def test_ids_are_monotonic_uuidv7():
+    ids = [new_id() for _ in range(10000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    parsed = uuid.UUID(ids[0])
+    assert parsed.version == 7
+    assert parsed.variant == uuid.RFC_4122
+    assert abs(id_timestamp(ids[-1]) - time.time()) < 5
+    assert floor_id(time.time() - 60) < ids[0] < floor_id(time.time() + 60)
+
+
+def test_list_tasks_pages_by_id_cursor():
+    store = InMemoryStore()
+    created = [store.create_task("user-1", {"title": f"t{i}"}) for i in range(5)]
+    store.create_task("user-2", {"title": "other"})
+
+    first = store.list_tasks("user-1", 2)
+    second = store.list_tasks("user-1", 2, after=first[-1]["id"])
+    rest = store.list_tasks("user-1", 10, after=second[-1]["id"])
+    assert [t["id"] for t in first + second + rest] == [t["id"] for t in created]
+    assert store.list_tasks("user-1", 10, after=floor_id(time.time() + 60)) == []
+
+
+def test_concurrent_creates_keep_user_index_sorted():
+    store = InMemoryStore()
+
+    def create(n):
+        for i in range(n):
+            store.create_task("user-1", {"title": f"t{i}"})
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=create, args=(2000,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    ids, tasks = store.tasks_by_user["user-1"]
+    assert len(ids) == 16000
+    assert ids == sorted(ids)
+    assert [task["id"] for task in tasks] == ids
+
+    paged, cursor = [], None
+    while True:
+        page = store.list_tasks("user-1", 500, after=cursor)
+        if not page:
+            break
+        paged.extend(task["id"] for task in page)
+        cursor = page[-1]["id"]
+    assert paged == ids
@@ -0,0 +1,39 @@
+import sys
+
+sys.path.append("src")
+
+from control_plane.liveness import LivenessTracker
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_heartbeats_keep_agents_live():
+    clock = _Clock()
+    tracker = LivenessTracker(ttl_seconds=10, tick_seconds=1, clock=clock)
+    events = []
+    tracker.subscribe(events.append)
+
+    tracker.beat("user-1", "jarvis")
+    tracker.beat("user-1", "friday")
+    tracker.beat("user-2", "jarvis")
+    assert sorted(tracker.live("user-1")) == ["friday", "jarvis"]
+    assert [e.type for e in events] == ["agent.online"] * 3
+
+    clock.now += 8
+    tracker.beat("user-1", "jarvis")
+    clock.now += 4
+    assert tracker.expire() == 2
+    assert list(tracker.live("user-1")) == ["jarvis"]
+    assert tracker.live("user-2") == {}
+    expired = sorted((e.user_id, e.agent_role) for e in events if e.type == "agent.expired")
+    assert expired == [("user-1", "friday"), ("user-2", "jarvis")]
+
+    clock.now += 1000
+    assert tracker.expire() == 1
+    assert tracker.count() == 0
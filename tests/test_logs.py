@@ -0,0 +1,45 @@
+import dataclasses
+import os
+import sys
+
+import jwt
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from loguru import logger
+
+sys.path.append("src")
+os.environ["AGENT_JWT_SECRET"] = "test-secret"
+
+from control_plane.auth import require_actor  # noqa: E402
+from control_plane.config import load_config  # noqa: E402
+from control_plane.logs import AccessLogMiddleware, configure_logging  # noqa: E402
+
+
+def test_access_log_carries_request_context():
+    configure_logging(dataclasses.replace(load_config(), log_format="json"))
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: str, actor=Depends(require_actor)):
+        logger.info("reading {}", item_id)
+        return {"id": item_id}
+
+    app.add_middleware(AccessLogMiddleware, sample_rate=1.0)
+    records = []
+    sink = logger.add(lambda message: records.append(message.record), level="INFO")
+    try:
+        token = jwt.encode({"type": "agent", "user_id": "user-logs", "agent_role": "jarvis"}, "test-secret")
+        response = TestClient(app).get("/items/42", headers={"X-Agent-Token": token})
+    finally:
+        logger.remove(sink)
+        configure_logging(load_config())
+
+    assert response.status_code == 200
+    inner = next(record for record in records if record["message"] == "reading 42")
+    access = next(record for record in records if record["message"].startswith("GET /items/{item_id} 200"))
+    assert inner["extra"]["user_id"] == "user-logs"
+    assert inner["extra"]["path"] == "/items/42"
+    assert access["extra"]["route"] == "/items/{item_id}"
+    assert access["extra"]["status"] == 200
+    assert access["extra"]["agent_role"] == "jarvis"
+    assert access["extra"]["latency_ms"] >= 0
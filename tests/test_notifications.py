@@ -0,0 +1,76 @@
+import sys
+
+sys.path.append("src")
+
+from control_plane.notifications import NotificationDispatcher, NotificationOutbox
+from control_plane.plugins.registry import PluginRegistry
+from control_plane.store import InMemoryStore
+
+
+def _setup(sink, **kwargs):
+    registry = PluginRegistry()
+    registry.register_service("notifications.stub", sink)
+    store = InMemoryStore()
+    dispatcher = NotificationDispatcher(registry, NotificationOutbox(), **kwargs)
+    store.subscribe(dispatcher.handle_event)
+    return store, dispatcher
+
+
+def test_notifications_coalesce_per_recipient():
+    batches = []
+    store, dispatcher = _setup(lambda recipient, batch: batches.append((recipient, batch)), window_seconds=60)
+    for i in range(3):
+        store.create_message("user-1", {"task_id": "t1", "content": f"m{i}", "actor_type": "agent"}, "jarvis")
+    store.create_message("user-2", {"task_id": "t2", "content": "hi", "actor_type": "agent"}, "jarvis")
+    store.create_message("user-1", {"task_id": "t1", "content": "mine", "actor_type": "human"})
+    store.create_task("user-1", {"title": "not notified"})
+
+    assert dispatcher.flush() == 4
+    by_recipient = {recipient: batch for recipient, batch in batches}
+    assert len(batches) == 2
+    assert len(by_recipient["user-1"]) == 3
+    assert by_recipient["user-2"][0]["agent_role"] == "jarvis"
+    assert dispatcher.stats()["pending"] == 0
+    dispatcher.stop()
+
+
+def test_notifications_retry_then_dead_letter():
+    calls = []
+
+    def failing(recipient, batch):
+        calls.append(len(batch))
+        raise RuntimeError("sink down")
+
+    store, dispatcher = _setup(failing, window_seconds=60, max_attempts=2, retry_base_seconds=0)
+    store.create_message("user-1", {"task_id": "t1", "content": "hello"})
+    dispatcher.flush()
+    assert dispatcher.stats()["pending"] == 1
+    dispatcher.flush()
+    stats = dispatcher.stats()
+    assert calls == [1, 1]
+    assert stats["pending"] == 0
+    assert stats["dead"] == 1
+    dispatcher.stop()
+
+
+def test_notifications_buffer_off_the_request_path():
+    batches = []
+    store, dispatcher = _setup(lambda recipient, batch: batches.append(batch), window_seconds=60, buffer_limit=3)
+    for i in range(2):
+        store.create_message("user-1", {"task_id": "t1", "content": f"m{i}"}, "jarvis")
+    stats = dispatcher.stats()
+    assert stats["buffered"] == 2
+    assert stats["pending"] == 0
+
+    store.create_message("user-1", {"task_id": "t1", "content": "m2"}, "jarvis")
+    stats = dispatcher.stats()
+    assert stats["buffered"] == 0
+    assert stats["pending"] == 3
+    assert stats["saturated"] == 1
+
+    dispatcher.start()
+    dispatcher.stop()
+    store.create_message("user-1", {"task_id": "t1", "content": "late"}, "jarvis")
+    assert dispatcher._thread is None
+    assert dispatcher.flush() == 1
+    assert sum(len(batch) for batch in batches) == 4
@@ -2,13 +2,17 @@ import json
 import os
 import sys
 import tempfile
+import time
 from typing import Optional
 
 sys.path.append("src")
 
 from control_plane.config import load_config
+from control_plane.plugins.hooks import HookPipeline
 from control_plane.plugins.loader import load_plugins
 from control_plane.plugins.runtime import PluginBlocked
+from control_plane.plugins.sandbox import SandboxCrashed
+from control_plane.plugins.schema import ConfigSchemaError, compile_schema
 
 
 def _write_plugin(root: str, plugin_id: str, kind: Optional[str] = None):
@@ -134,3 +138,229 @@ def test_prompt_guard_blocks():
             assert False, "expected PluginBlocked"
         except PluginBlocked:
             assert True
+
+
+def test_config_schema_validated_at_load():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plugin_dir = os.path.join(temp_dir, "plugin-a")
+        _write_plugin(plugin_dir, "plugin-a")
+        manifest_path = os.path.join(plugin_dir, "openclaw.plugin.json")
+        with open(manifest_path, "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        manifest["configSchema"] = {
+            "type": "object",
+            "properties": {
+                "timeout_seconds": {"type": "number", "default": 30},
+                "strict": {"type": "boolean"},
+            },
+            "additionalProperties": False,
+        }
+        with open(manifest_path, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle)
+        with open(os.path.join(plugin_dir, "plugin.py"), "w", encoding="utf-8") as handle:
+            handle.write(
+                "def register(api):\n"
+                "    api.register_tool('config', dict(api.config))\n"
+            )
+
+        def load(entry_config):
+            config_path = os.path.join(temp_dir, "config.json")
+            with open(config_path, "w", encoding="utf-8") as handle:
+                json.dump(
+                    {
+                        "plugins": {
+                            "enabled": True,
+                            "allow": [],
+                            "deny": [],
+                            "entries": {"plugin-a": {"enabled": True, "config": entry_config}},
+                            "slots": {},
+                            "load": {"paths": [plugin_dir]},
+                        }
+                    },
+                    handle,
+                )
+            os.environ["CONTROL_PLANE_PLUGIN_CONFIG_PATH"] = config_path
+            os.environ["CONTROL_PLANE_PLUGIN_PATHS"] = ""
+            return load_plugins(load_config())
+
+        registry = load({"strict": "true"})
+        assert registry.tools["config"] == {"timeout_seconds": 30, "strict": True}
+
+        for bad in ({"strict": "maybe"}, {"unknown": 1}):
+            try:
+                load(bad)
+                assert False, "expected ConfigSchemaError"
+            except ConfigSchemaError as exc:
+                assert "plugin-a" in str(exc)
+
+
+def test_schema_length_keywords_apply_per_type():
+    validate = compile_schema(
+        {"type": ["string", "array"], "minLength": 2, "maxLength": 3, "minItems": 1, "maxItems": 1}
+    )
+    assert validate("abc", "config") == "abc"
+    assert validate(["x"], "config") == ["x"]
+    for bad in ("a", "abcd", [], ["x", "y"]):
+        try:
+            validate(bad, "config")
+            assert False, f"expected ConfigSchemaError for {bad!r}"
+        except ConfigSchemaError:
+            pass
+
+
+def test_schema_rejects_unsupported_keywords():
+    for schema in (
+        {"type": "string", "pattern": "^a"},
+        {"type": "object", "properties": {"mode": {"oneOf": [{"const": "a"}]}}},
+        {"type": "array", "items": {"$ref": "#/defs/x"}},
+    ):
+        try:
+            compile_schema(schema)
+            assert False, f"expected ConfigSchemaError for {schema}"
+        except ConfigSchemaError as exc:
+            assert "unsupported schema keyword" in str(exc)
+    compile_schema({"type": "string", "title": "Name", "description": "annotations are fine"})
+
+
+def test_process_isolated_plugin():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plugin_dir = os.path.join(temp_dir, "heavy")
+        _write_plugin(plugin_dir, "heavy")
+        with open(os.path.join(plugin_dir, "plugin.py"), "w", encoding="utf-8") as handle:
+            handle.write(
+                "import os\n"
+                "def register(api):\n"
+                "    def hook(payload):\n"
+                "        if payload.get('crash'):\n"
+                "            os._exit(1)\n"
+                "        if payload.get('block'):\n"
+                "            raise api.PluginBlocked('blocked in sandbox', status_code=422)\n"
+                "    api.register_hook('before_task_create', hook, independent=True)\n"
+                "    api.register_tool('pid', {'name': 'pid', 'handler': lambda args: os.getpid()})\n"
+                "    api.register_command('double', lambda args: args['n'] * 2)\n"
+                "    api.register_service('notifications.count', lambda recipient, batch: len(batch))\n"
+            )
+
+        config_path = os.path.join(temp_dir, "config.json")
+        with open(config_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "plugins": {
+                        "enabled": True,
+                        "allow": [],
+                        "deny": [],
+                        "entries": {"heavy": {"enabled": True, "isolation": "process"}},
+                        "slots": {},
+                        "sandbox": {"workers": 1},
+                        "load": {"paths": [plugin_dir]},
+                    }
+                },
+                handle,
+            )
+
+        os.environ["CONTROL_PLANE_PLUGIN_CONFIG_PATH"] = config_path
+        os.environ["CONTROL_PLANE_PLUGIN_PATHS"] = ""
+        registry = load_plugins(load_config())
+        try:
+            hook = registry.hooks["before_task_create"][0]
+            assert hook.independent
+            hook({"payload": {}})
+            assert registry.tools["pid"]["handler"]({}) != os.getpid()
+            assert registry.commands["double"]({"n": 21}) == 42
+            assert registry.services["notifications.count"]("user-1", [{}, {}]) == 2
+
+            try:
+                hook({"block": True})
+                assert False, "expected PluginBlocked"
+            except PluginBlocked as exc:
+                assert exc.status_code == 422
+
+            try:
+                hook({"crash": True})
+                assert False, "expected SandboxCrashed"
+            except SandboxCrashed:
+                pass
+            hook({"payload": {}})
+
+            stats = registry.sandbox.stats()
+            assert stats["restarts"] == 1
+            assert stats["plugins"]["heavy"]["calls"] == 7
+            assert stats["plugins"]["heavy"]["errors"] == 1
+        finally:
+            registry.sandbox.shutdown()
+
+
+def test_sandbox_timeout_applies_through_hook_pipeline():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plugin_dir = os.path.join(temp_dir, "sleepy")
+        _write_plugin(plugin_dir, "sleepy")
+        with open(os.path.join(plugin_dir, "plugin.py"), "w", encoding="utf-8") as handle:
+            handle.write(
+                "import time\n"
+                "def register(api):\n"
+                "    api.register_hook('before_task_create', lambda payload: time.sleep(payload.get('sleep', 0)))\n"
+            )
+
+        config_path = os.path.join(temp_dir, "config.json")
+        with open(config_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "plugins": {
+                        "enabled": True,
+                        "allow": [],
+                        "deny": [],
+                        "entries": {"sleepy": {"enabled": True, "isolation": "process"}},
+                        "slots": {},
+                        "sandbox": {"workers": 1, "timeout_seconds": 1.5},
+                        "load": {"paths": [plugin_dir]},
+                    }
+                },
+                handle,
+            )
+
+        os.environ["CONTROL_PLANE_PLUGIN_CONFIG_PATH"] = config_path
+        os.environ["CONTROL_PLANE_PLUGIN_PATHS"] = ""
+        registry = load_plugins(load_config())
+        pipeline = HookPipeline(registry, timeout_seconds=0.5)
+        try:
+            started = time.monotonic()
+            try:
+                pipeline.run("before_task_create", {"sleep": 10})
+                assert False, "expected SandboxCrashed"
+            except SandboxCrashed as exc:
+                assert exc.status_code == 503
+            assert time.monotonic() - started < 3
+            pipeline.run("before_task_create", {})
+            assert registry.sandbox.stats()["restarts"] == 1
+        finally:
+            pipeline.shutdown()
+            registry.sandbox.shutdown()
+
+
+def test_process_isolation_rejected_for_entry_point_plugins(monkeypatch):
+    from control_plane.plugins import loader
+    from control_plane.plugins.manifest import PluginManifest
+
+    manifest = PluginManifest(
+        id="packaged",
+        name="Packaged",
+        version="0.1.0",
+        entry="packaged.plugin:plugin",
+        kind=None,
+        config_schema={},
+        ui_hints={},
+    )
+    monkeypatch.setattr(
+        loader, "_discover_entrypoint_plugins", lambda: [("packaged.plugin:plugin", manifest, lambda api: None)]
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "config.json")
+        with open(config_path, "w", encoding="utf-8") as handle:
+            json.dump({"plugins": {"entries": {"packaged": {"isolation": "process"}}}}, handle)
+        monkeypatch.setenv("CONTROL_PLANE_PLUGIN_CONFIG_PATH", config_path)
+        monkeypatch.setenv("CONTROL_PLANE_PLUGIN_PATHS", "")
+        try:
+            load_plugins(load_config())
+            assert False, "expected ValueError"
+        except ValueError as exc:
+            assert "local-path plugins" in str(exc)
@@ -0,0 +1,31 @@
+import sys
+
+sys.path.append("src")
+
+from control_plane.standup import StandupRollups
+from control_plane.store import InMemoryStore
+
+
+def test_rollups_track_creates_and_status_changes():
+    store = InMemoryStore()
+    rollups = StandupRollups()
+    store.subscribe(rollups.handle_event)
+
+    old = store.create_task("user-1", {"title": "Old"}, "jarvis")
+    task = store.create_task("user-1", {"title": "Ship"}, "jarvis")
+    store.create_task("user-2", {"title": "Other"}, "jarvis")
+    store.create_message("user-1", {"task_id": task["id"], "content": "a"}, "friday")
+    store.create_message("user-1", {"task_id": task["id"], "content": "b"}, "friday")
+    store.create_message("user-1", {"task_id": "no-such-task", "content": "c"}, "friday")
+    store.update_task_status("user-1", old["id"], "done", "jarvis")
+
+    summary = rollups.summary("user-1", since=0)
+    assert summary["counts_by_status"] == {"in_progress": 1, "done": 1}
+    assert [t["id"] for t in summary["tasks"]] == [old["id"], task["id"]]
+    assert summary["tasks"][1]["messages"] == 2
+    assert summary["tasks"][0]["status"] == "done"
+    assert set(summary["last_activity"]) == {"jarvis", "friday"}
+
+    later = rollups.summary("user-1", since=summary["until"] + 1, until=summary["until"] + 2)
+    assert later["tasks"] == []
+    assert later["counts_by_status"] == {"in_progress": 1, "done": 1}
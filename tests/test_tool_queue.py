@@ -0,0 +1,88 @@
+import asyncio
+import sys
+
+sys.path.append("src")
+
+from control_plane.tool_queue import LeaseError, ToolRequestQueue
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lease_order_follows_priority():
+    queue = ToolRequestQueue()
+    low = queue.enqueue("user-1", "echo", {}, priority=0)
+    high = queue.enqueue("user-1", "echo", {}, priority=5)
+    queue.enqueue("user-2", "echo", {}, priority=9)
+
+    leased = queue.lease("user-1", "w1", max_items=5)
+    assert [r.id for r in leased] == [high.id, low.id]
+    assert queue.lease("user-1", "w1") == []
+
+
+def test_expired_lease_is_reclaimed_then_failed():
+    clock = _Clock()
+    queue = ToolRequestQueue(visibility_timeout=10, max_attempts=2, clock=clock)
+    request = queue.enqueue("user-1", "qmd_search", {"query": "x"})
+
+    first = queue.lease("user-1", "w1")[0]
+    token = first.lease_token
+    clock.now += 11
+    second = queue.lease("user-1", "w2")[0]
+    assert second.id == request.id and second.attempts == 1
+    try:
+        queue.complete("user-1", request.id, token, result={})
+        assert False, "expected LeaseError"
+    except LeaseError:
+        pass
+
+    clock.now += 11
+    assert queue.lease("user-1", "w3") == []
+    assert queue.get("user-1", request.id).status == "failed"
+
+
+def test_long_poll_wakes_on_completion():
+    queue = ToolRequestQueue()
+    request = queue.enqueue("user-1", "echo", {"message": "hi"})
+    leased = queue.lease("user-1", "w1")[0]
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, queue.complete, "user-1", request.id, leased.lease_token, {"message": "hi"})
+        return await queue.wait("user-1", request.id, timeout=5)
+
+    finished = asyncio.run(scenario())
+    assert finished.status == "done"
+    assert finished.result == {"message": "hi"}
+
+
+def test_expired_lease_fails_waiters_without_another_lease_call():
+    queue = ToolRequestQueue(visibility_timeout=0.05, max_attempts=1)
+    request = queue.enqueue("user-1", "echo", {})
+    polled = queue.enqueue("user-1", "echo", {})
+    queue.lease("user-1", "w1", max_items=2)
+
+    async def scenario():
+        started = asyncio.get_running_loop().time()
+        finished = await queue.wait("user-1", polled.id, timeout=5)
+        return finished, asyncio.get_running_loop().time() - started
+
+    finished, elapsed = asyncio.run(scenario())
+    assert finished.status == "failed"
+    assert finished.error == "lease expired"
+    assert elapsed < 1
+    assert queue.get("user-1", request.id).status == "failed"
+
+
+def test_get_reclaims_expired_lease():
+    clock = _Clock()
+    queue = ToolRequestQueue(visibility_timeout=10, max_attempts=1, clock=clock)
+    request = queue.enqueue("user-1", "echo", {})
+    queue.lease("user-1", "w1")
+    clock.now += 11
+    assert queue.get("user-1", request.id).status == "failed"